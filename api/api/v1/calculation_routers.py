@@ -2,8 +2,6 @@
 Calculation Routers - Calculate, report, export, save/load, and safety check endpoints.
 """
 
-import io
-import base64
 import re
 import logging
 import asyncio
@@ -17,14 +15,13 @@ matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 import numpy as np
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
 from fastapi.responses import Response
 
 from guv_calcs import WHOLE_ROOM_FLUENCE, EYE_LIMITS, SKIN_LIMITS
 from guv_calcs.project import Project
 
-from .schemas import SimulationZoneResult
-from .utils import get_theme_colors
+from .utils import get_theme_colors, fig_to_image, ImageFormat, NumpyJSONStreamingResponse, run_plot, PLOT_LOCK, ORJSONRoute
 from .session_helpers import (
     SessionDep,
     InitializedSessionDep,
@@ -40,7 +37,7 @@ from .session_helpers import (
     _lamp_to_loaded,
     _zone_to_loaded,
 )
-from .session_manager import get_session_manager
+from .session_manager import Session, get_session_manager
 from .session_schemas import (
     SuccessResponse,
     StateHashesResponse,
@@ -60,7 +57,7 @@ from .session_schemas import (
     NudgeIntoBoundsResponse,
 )
 from .resource_limits import (
-    estimate_session_cost,
+    estimate_session_totals,
     check_budget,
     log_calculation_start,
     log_calculation_complete,
@@ -73,7 +70,7 @@ from .resource_limits import (
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+router = APIRouter(route_class=ORJSONRoute)
 
 # Thread pool for async calculations.
 # Use 2x MAX_CONCURRENT_CALCULATIONS so zombie threads from timed-out
@@ -103,7 +100,7 @@ def get_calculation_estimate(session: InitializedSessionDep):
 
     Call this before /calculate to show a progress indicator.
     """
-    estimate = estimate_session_cost(session)
+    estimate = estimate_session_totals(session)
     calc_time = estimate['calc_time_seconds']
     peak_mb = estimate['peak_memory_mb']
     return CalculationEstimateResponse(
@@ -134,10 +131,10 @@ async def calculate_session(session: InitializedSessionDep):
     Requires X-Session-ID header.
     """
     # Pre-flight budget check
-    check_budget(session)
+    estimate = check_budget(session)
 
-    # Log calculation start with cost estimate
-    estimate = log_calculation_start(session)
+    # Log calculation start with the same cost estimate
+    log_calculation_start(session, estimate)
 
     # Get the calculation semaphore
     calc_semaphore = _get_calc_semaphore()
@@ -195,7 +192,8 @@ async def calculate_session(session: InitializedSessionDep):
             actual_time = time.perf_counter() - calc_start
             log_calculation_complete(estimate, actual_time)
 
-            # Collect results
+            # Collect results. Values stay as ndarrays and are serialized by
+            # orjson straight from the buffer instead of via .tolist().
             zone_results = {}
             mean_fluence = None
 
@@ -203,45 +201,40 @@ async def calculate_session(session: InitializedSessionDep):
                 values = zone.get_values()
                 zone_type = zone.calctype.lower()
                 statistics = zone.get_statistics() or {"min": None, "max": None, "mean": None, "std": None}
+                num_points = list(zone.num_points) if hasattr(zone, 'num_points') else None
 
+                reshaped_values = None
                 if values is not None:
                     # Track WholeRoomFluence mean (raw fluence rate)
                     if zone_id == WHOLE_ROOM_FLUENCE and statistics.get("mean") is not None:
                         mean_fluence = statistics["mean"]
 
                     # Reshape values for frontend
-                    reshaped_values = None
-                    if hasattr(zone, 'num_points'):
+                    if num_points is not None:
                         try:
-                            num_points = zone.num_points
-                            reshaped_values = values.reshape(num_points).tolist()
+                            reshaped_values = np.ascontiguousarray(values.reshape(num_points))
                         except Exception as e:
                             logger.warning(f"Failed to reshape values for zone {zone_id}: {e}")
-                            reshaped_values = values.tolist() if hasattr(values, 'tolist') else None
-
-                    zone_results[zone_id] = SimulationZoneResult(
-                        zone_id=zone_id,
-                        zone_name=getattr(zone, 'name', None),
-                        zone_type=zone_type,
-                        statistics=statistics,
-                        num_points=list(zone.num_points) if hasattr(zone, 'num_points') else None,
-                        values=reshaped_values,
-                    )
+                            reshaped_values = np.ascontiguousarray(values) if hasattr(values, 'reshape') else None
                 else:
-                    zone_results[zone_id] = SimulationZoneResult(
-                        zone_id=zone_id,
-                        zone_name=getattr(zone, 'name', None),
-                        zone_type=zone_type,
-                        statistics=statistics,
-                    )
+                    num_points = None
+
+                zone_results[zone_id] = {
+                    "zone_id": zone_id,
+                    "zone_name": getattr(zone, 'name', None),
+                    "zone_type": zone_type,
+                    "statistics": statistics,
+                    "num_points": num_points,
+                    "values": reshaped_values,
+                }
 
             logger.info("Calculation completed successfully")
 
             # Include state hashes so frontend can snapshot "last calculated" state
-            state_hashes = StateHashesResponse(
-                calc_state=session.room.get_calc_state(),
-                update_state=session.room.get_update_state(),
-            )
+            state_hashes = {
+                "calc_state": session.room.get_calc_state(),
+                "update_state": session.room.get_update_state(),
+            }
 
             # Compute per-wavelength fluence from WholeRoomFluence zone
             fluence_by_wavelength = None
@@ -263,15 +256,18 @@ async def calculate_session(session: InitializedSessionDep):
             except Exception as e:
                 logger.debug(f"Ozone estimate failed: {e}")
 
-            return CalculateResponse(
-                success=True,
-                calculated_at=datetime.utcnow().isoformat(),
-                mean_fluence=mean_fluence,
-                fluence_by_wavelength=fluence_by_wavelength,
-                ozone_increase_ppb=ozone_increase_ppb,
-                zones=zone_results,
-                state_hashes=state_hashes,
-            )
+            # Shaped like CalculateResponse, but rendered directly so the
+            # value grids skip pydantic validation and list conversion, and
+            # streamed so large grids are encoded a slab at a time.
+            return NumpyJSONStreamingResponse({
+                "success": True,
+                "calculated_at": datetime.utcnow().isoformat(),
+                "mean_fluence": mean_fluence,
+                "fluence_by_wavelength": fluence_by_wavelength,
+                "ozone_increase_ppb": ozone_increase_ppb,
+                "zones": zone_results,
+                "state_hashes": state_hashes,
+            })
 
         except HTTPException:
             # Re-raise HTTP exceptions (timeout, budget exceeded)
@@ -346,18 +342,23 @@ def export_session_all(session: InitializedSessionDep, include_plots: bool = Fal
 
     try:
         logger.info(f"Exporting all results as ZIP (include_plots={include_plots}, include_report={include_report})...")
-        # Use explicit light theme to prevent dark_background style leakage
-        # from concurrent matplotlib usage (e.g. get_zone_plot)
-        with plt.style.context('default'):
-            plt.rcParams.update({
-                'figure.facecolor': 'white',
-                'axes.facecolor': 'white',
-                'text.color': 'black',
-                'axes.labelcolor': 'black',
-                'xtick.color': 'black',
-                'ytick.color': 'black',
-            })
-            zip_bytes = session.room.export_zip(include_plots=include_plots, include_report=include_report)
+        if include_plots:
+            # Use explicit light theme to prevent dark_background style leakage
+            # from concurrent matplotlib usage (e.g. get_zone_plot)
+            with PLOT_LOCK, plt.style.context('default'):
+                plt.rcParams.update({
+                    'figure.facecolor': 'white',
+                    'axes.facecolor': 'white',
+                    'text.color': 'black',
+                    'axes.labelcolor': 'black',
+                    'xtick.color': 'black',
+                    'ytick.color': 'black',
+                })
+                zip_bytes = session.room.export_zip(include_plots=True, include_report=include_report)
+        else:
+            # Without plots the export never touches pyplot, so it needn't
+            # wait behind renders for the lock.
+            zip_bytes = session.room.export_zip(include_plots=False, include_report=include_report)
 
         return Response(
             content=zip_bytes,
@@ -441,20 +442,33 @@ def get_disinfection_table(session: InitializedSessionDep, zone_id: str = WHOLE_
 
 
 @router.get("/survival-plot")
-def get_survival_plot(
+async def get_survival_plot(
     session: InitializedSessionDep,
     zone_id: str = WHOLE_ROOM_FLUENCE,
     theme: str = "dark",
     dpi: int = 100,
-    species: str = None
+    species: str = None,
+    image_format: ImageFormat = Query("png", alias="format"),
 ):
     """
-    Get survival plot as PNG image.
+    Get survival plot as a base64 image (PNG by default; ?format=svg|webp).
 
     Shows survival fraction over time for key pathogens.
 
     Requires X-Session-ID header.
     """
+    return await run_plot(_render_survival_plot, session, zone_id, theme, dpi, species, image_format)
+
+
+def _render_survival_plot(
+    session: Session,
+    zone_id: str,
+    theme: str,
+    dpi: int,
+    species: Optional[str],
+    image_format: ImageFormat,
+):
+    """Render a survival plot; runs on the plot pool."""
     zone = session.room.calc_zones.get(zone_id)
     if zone is None:
         raise HTTPException(status_code=404, detail=f"Zone {zone_id} not found")
@@ -504,18 +518,8 @@ def get_survival_plot(
                             title = title.replace(' at ', '\nat ', 1)
                         ax.set_title(title, color=text_color, fontsize=20)
 
-                # Convert to base64
-                buf = io.BytesIO()
-                fig.savefig(buf, format='png', dpi=dpi, bbox_inches='tight',
-                            facecolor=bg_color, edgecolor='none')
-                buf.seek(0)
-
-            image_base64 = base64.b64encode(buf.read()).decode('utf-8')
-
-            return {
-                "image_base64": image_base64,
-                "content_type": "image/png"
-            }
+                return fig_to_image(fig, image_format, dpi=dpi, bbox_inches='tight',
+                                    facecolor=bg_color, edgecolor='none')
         finally:
             if fig is not None:
                 plt.close(fig)
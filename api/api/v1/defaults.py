@@ -6,7 +6,6 @@ from typing import Dict
 
 from guv_calcs import DEFAULT_DIMS
 from guv_calcs.safety import PhotStandard, get_tlvs
-from guv_calcs.standard_zones import get_zone_config
 
 # Room dimensions — guv_calcs canonical order is (x=6, y=4, z=2.7);
 # illuminate uses swapped X/Y orientation so the longer wall faces the user.
@@ -37,19 +36,14 @@ PRECISION = 1
 
 # ==== Field of View Defaults ====
 from guv_calcs import PlaneCalcMode
-FOV_VERT_EYE = PlaneCalcMode.EYE_WORST_CASE.spec.fov_vert  # 80
-FOV_HORIZ_EYE = PlaneCalcMode.EYE_WORST_CASE.spec.fov_horiz  # 120
+_eye_spec = PlaneCalcMode.EYE_WORST_CASE.spec
+FOV_VERT_EYE = _eye_spec.fov_vert  # 80
+FOV_HORIZ_EYE = _eye_spec.fov_horiz  # 120
 FOV_VERT_SKIN = 180  # Skin uses full vertical FOV
 FOV_HORIZ = 360      # Non-eye zones use full horizontal FOV
 
 # ==== TLV Limits by Standard (mJ/cm² over 8 hours at 222nm) ====
-_TLV_LABEL_MAP = {
-    PhotStandard.ACGIH: PhotStandard.ACGIH.label,
-    PhotStandard.UL8802: PhotStandard.UL8802.label,
-    PhotStandard.ICNIRP: PhotStandard.ICNIRP.label,
-}
 TLV_LIMITS: Dict[str, Dict[str, float]] = {
-    _TLV_LABEL_MAP[std]: dict(zip(("skin", "eye"), (round(v, 1) for v in get_tlvs(222, std))))
+    std.label: dict(zip(("skin", "eye"), (round(v, 1) for v in get_tlvs(222, std))))
     for std in PhotStandard
 }
-
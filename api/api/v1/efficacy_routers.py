@@ -14,17 +14,21 @@ from functools import lru_cache
 import numpy as np
 import pandas as pd
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel, Field
-from typing import Optional, List
+from typing import Literal, Optional, List
 import logging
 
 from guv_calcs.efficacy import InactivationData
 from guv_calcs.efficacy.math import log1, log2, log3, eACH_UV
 
+from .utils import ORJSONRoute, iter_ndjson
+from .utils.serialization import dumps
+
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/efficacy", tags=["Efficacy"])
+router = APIRouter(prefix="/efficacy", tags=["Efficacy"], route_class=ORJSONRoute)
 
 
 # === Request/Response Models ===
@@ -99,18 +103,82 @@ class EfficacyExploreResponse(BaseModel):
 
 @lru_cache(maxsize=16)
 def _get_inactivation_data(fluence: float):
-    """Cache the expensive InactivationData construction keyed by fluence.
+    """Cache the expensive InactivationData construction keyed by fluence."""
+    return InactivationData(fluence=fluence)
+
+
+@lru_cache(maxsize=16)
+def _get_full_table(fluence):
+    """Computed table for a fluence (None: the base table), copied once.
 
-    Since subset() is non-mutating (returns a new instance), callers can
-    safely call .subset() on the cached instance without side effects.
+    full_df returns a fresh copy of the whole table on every access. Routes
+    only select rows from it with _filter_rows and never mutate it, so one
+    copy per cached instance is shared.
     """
-    return InactivationData(fluence=fluence)
+    if fluence is None:
+        return _get_base_inactivation_data().full_df
+    return _get_inactivation_data(fluence).full_df
+
+
+@lru_cache(maxsize=1)
+def _valid_wavelength_set() -> frozenset:
+    """Exact (float) wavelengths in the database, for filter validation."""
+    return frozenset(InactivationData.get_valid_wavelengths())
+
+
+@lru_cache(maxsize=64)
+def _matching_cells(column: str, value: str) -> frozenset:
+    """Distinct values of a Medium/Category column that subset() keeps for value.
+
+    subset() matches words (and aliases such as "air" for Aerosol) once per
+    row; these columns have only a handful of distinct values, so resolve
+    the filter once against the base table and select rows by membership.
+    """
+    data = _get_base_inactivation_data().subset(**{column.lower(): value})
+    return frozenset(data.full_df[column].dropna())
+
+
+def _words_mask(column, value) -> np.ndarray:
+    """Boolean row mask selecting the same rows as subset(medium/category=value)."""
+    return column.isin(_matching_cells(column.name, value)).to_numpy()
+
+
+def _row_mask(df, wavelength=None, medium=None, category=None) -> np.ndarray:
+    """Boolean mask of the rows of a cached table matching the filters.
+
+    Selects the same rows as chaining data.subset(wavelength=...,
+    medium=..., category=...) and reading full_df, with the filters
+    combined into one mask instead of re-filtering (and, for full_df,
+    copying) the table once per filter. Unknown wavelengths raise the same
+    KeyError subset() does.
+    """
+    mask = np.ones(len(df), dtype=bool)
+    if wavelength:
+        if wavelength not in _valid_wavelength_set():
+            raise KeyError(
+                f"{wavelength} is not a valid wavelength; "
+                f"must be in {InactivationData.get_valid_wavelengths()}"
+            )
+        mask &= df["wavelength [nm]"].to_numpy() == wavelength
+    if medium:
+        mask &= _words_mask(df["Medium"], medium)
+    if category:
+        mask &= _words_mask(df["Category"], category)
+    return mask
+
 
+def _filter_rows(df, wavelength=None, medium=None, category=None):
+    """Rows of a cached table matching the filters (see _row_mask), in order."""
+    mask = _row_mask(df, wavelength, medium, category)
+    return df if mask.all() else df[mask]
 
-def _build_table_df(data):
-    """Extract the table DataFrame with desired columns from an InactivationData instance."""
-    df = data.full_df
 
+def _build_table_df(df):
+    """Project a (filtered) computed table onto the table columns.
+
+    Missing cells are left as NaN; _table_content's rows are rendered with
+    orjson, which writes NaN as null, so no None-substituted copy is needed.
+    """
     desired_cols = [
         "Category", "Species", "Strain", "wavelength [nm]",
         "k1 [cm2/mJ]", "k2 [cm2/mJ]", "% resistant",
@@ -118,9 +186,54 @@ def _build_table_df(data):
         "eACH-UV", "Seconds to 99% inactivation",
     ]
     available_cols = [c for c in desired_cols if c in df.columns]
-    df = df[available_cols]
-    df = df.where(df.notna(), None)
-    return df
+    return df[available_cols]
+
+
+def _table_content(df) -> dict:
+    """Shape a table DataFrame like EfficacyTableResponse, as a plain dict.
+
+    The table is several hundred rows of mixed-type cells; building the model
+    would copy and validate every row before serializing, so the table
+    routes render this dict with orjson instead.
+    """
+    return {
+        "columns": df.columns.tolist(),
+        "rows": df.values.tolist(),
+        "count": len(df),
+    }
+
+
+@lru_cache(maxsize=64)
+def _table_json(fluence, wavelength=None, medium=None, category=None) -> bytes:
+    """Serialized /table body for one filter combination.
+
+    The table is a pure function of these arguments, so repeat requests
+    reuse the rendered bytes for the life of the process.
+    """
+    df = _filter_rows(_get_full_table(fluence), wavelength, medium, category)
+    return dumps(_table_content(_build_table_df(df)))
+
+
+@lru_cache(maxsize=16)
+def _explore_json(fluence) -> bytes:
+    """Serialized /explore body; fluence=None uses the base (no-fluence) table."""
+    return dumps({
+        "categories": list(_valid_categories()),
+        "mediums": list(_valid_mediums()),
+        "wavelengths": list(_valid_wavelengths()),
+        "table": _table_content(_build_table_df(_get_full_table(fluence))),
+    })
+
+
+def _iter_table_records(df):
+    """Yield one {column: value} dict per table row.
+
+    One df.values.tolist() over the whole (mixed-dtype) frame is several
+    times faster than per-column tolist() + zip at this table's size.
+    """
+    columns = df.columns.tolist()
+    for values in df.values.tolist():
+        yield dict(zip(columns, values))
 
 
 @lru_cache(maxsize=1)
@@ -133,6 +246,40 @@ def _get_base_inactivation_data():
     return InactivationData()
 
 
+@lru_cache(maxsize=1)
+def _valid_categories() -> tuple[str, ...]:
+    """Cache the category list; get_valid_*() copy the full table per call."""
+    return tuple(InactivationData.get_valid_categories())
+
+
+@lru_cache(maxsize=1)
+def _valid_mediums() -> tuple[str, ...]:
+    """Cache the medium list (see _valid_categories)."""
+    return tuple(InactivationData.get_valid_mediums())
+
+
+@lru_cache(maxsize=1)
+def _valid_wavelengths() -> tuple[int, ...]:
+    """Cache the wavelength list (see _valid_categories)."""
+    return tuple(int(w) for w in InactivationData.get_valid_wavelengths())
+
+
+def warm_efficacy_cache() -> None:
+    """Fill the metadata and base-table caches so the first request doesn't pay for them.
+
+    The UI prefetches /explore without a fluence after every calculation,
+    so that body is rendered up front as well.
+    """
+    try:
+        _valid_categories()
+        _valid_mediums()
+        _valid_wavelengths()
+        _explore_json(None)
+    except Exception as e:
+        # Endpoints retry (and report) on demand; don't block startup.
+        logger.warning(f"Failed to warm efficacy cache: {e}")
+
+
 # === Endpoints ===
 
 @router.get("/species")
@@ -142,12 +289,9 @@ def get_species(
 ) -> dict[str, list[str]]:
     """Return all species grouped by category, optionally filtered by wavelength and medium."""
     try:
-        data = InactivationData()
-        if wavelength is not None:
-            data = data.subset(wavelength=wavelength)
-        if medium is not None:
-            data = data.subset(medium=medium)
-        df = data.full_df
+        df = _filter_rows(
+            _get_full_table(None), wavelength=wavelength, medium=medium
+        )
         grouped: dict[str, list[str]] = {}
         for category in sorted(df["Category"].dropna().unique()):
             species_list = sorted(
@@ -165,7 +309,7 @@ def get_species(
 def get_categories() -> List[str]:
     """Get available organism categories from the efficacy database"""
     try:
-        return InactivationData.get_valid_categories()
+        return list(_valid_categories())
     except Exception as e:
         logger.error(f"Failed to get categories: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to get categories: {str(e)}")
@@ -175,7 +319,7 @@ def get_categories() -> List[str]:
 def get_mediums() -> List[str]:
     """Get available test mediums from the efficacy database"""
     try:
-        return InactivationData.get_valid_mediums()
+        return list(_valid_mediums())
     except Exception as e:
         logger.error(f"Failed to get mediums: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to get mediums: {str(e)}")
@@ -186,9 +330,9 @@ def get_wavelengths(medium: Optional[str] = None) -> List[int]:
     """Get available wavelengths from the efficacy database, optionally filtered by medium."""
     try:
         if medium is not None:
-            data = InactivationData().subset(medium=medium)
-            return sorted(int(w) for w in data.full_df["wavelength [nm]"].dropna().unique())
-        return [int(w) for w in InactivationData.get_valid_wavelengths()]
+            df = _filter_rows(_get_full_table(None), medium=medium)
+            return sorted(int(w) for w in df["wavelength [nm]"].dropna().unique())
+        return list(_valid_wavelengths())
     except Exception as e:
         logger.error(f"Failed to get wavelengths: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to get wavelengths: {str(e)}")
@@ -202,31 +346,34 @@ def get_efficacy_summary(request: EfficacySummaryRequest):
     Returns time to 90%, 99%, and 99.9% inactivation for key respiratory pathogens.
     """
     try:
-        data = InactivationData(fluence=request.fluence)
-
-        # Subset to aerosol data at specified wavelength
-        if request.wavelength:
-            data = data.subset(wavelength=request.wavelength)
-        data = data.subset(medium="Aerosol")
-
-        df = data.table()
+        # Aerosol data at the specified wavelength, ordered like table()
+        df = _filter_rows(
+            _get_full_table(request.fluence),
+            wavelength=request.wavelength,
+            medium="Aerosol",
+        ).sort_values("Species")
 
-        results = []
         target_species = ["Human coronavirus", "Influenza"]
+        # Lowercase the column once; each target is then a plain substring
+        # scan instead of a case-insensitive regex pass over the Series.
+        species_lower = np.char.lower(df["Species"].fillna("").to_numpy(dtype=str))
 
+        results = []
         for species in target_species:
             # Search for matching species (case-insensitive partial match)
-            mask = df["Species"].str.contains(species, case=False, na=False)
-            rows = df[mask]
+            matches = np.flatnonzero(np.char.find(species_lower, species.lower()) >= 0)
 
-            if not rows.empty:
+            if matches.size:
                 # Use the first matching row
-                row = rows.iloc[0]
+                row = df.iloc[matches[0]]
 
-                # Get k values
-                k1 = row.get("k1 [cm2/mJ]", 0) or 0
-                k2 = row.get("k2 [cm2/mJ]", 0) or 0
-                f = row.get("f", 0) or 0  # Resistant fraction
+                # Get k values. Rows with no second phase have NaN k2/f;
+                # treat them as 0 (single-phase decay) or the survival curve
+                # is NaN everywhere and the solver collapses to t=0.
+                k1, k2, f = np.nan_to_num(np.array(
+                    [row.get(col, 0) for col in ("k1 [cm2/mJ]", "k2 [cm2/mJ]", "f")],
+                    dtype=np.float64,
+                )).tolist()
 
                 if k1 > 0:
                     try:
@@ -260,32 +407,34 @@ def get_efficacy_summary(request: EfficacySummaryRequest):
 
 
 @router.post("/table", response_model=EfficacyTableResponse)
-def get_efficacy_table(request: EfficacyTableRequest):
+def get_efficacy_table(
+    request: EfficacyTableRequest,
+    response_format: Literal["json", "ndjson"] = Query(
+        "json", alias="format", description="json (default) or ndjson, one row object per line"
+    ),
+):
     """
     Get filtered pathogen data table.
 
     Returns all base columns plus computed columns from the efficacy database,
     filtered by wavelength, medium, and/or category. Uses full_df to avoid
     the display column selection that table() performs.
+
+    With ``?format=ndjson`` the rows are streamed as newline-delimited
+    ``{column: value}`` objects instead of one columns/rows document.
+
+    JSON bodies are cached per (fluence, wavelength, medium, category).
     """
     try:
-        data = _get_inactivation_data(request.fluence)
-
-        # Apply filters (subset is non-mutating, returns new instance)
-        if request.wavelength:
-            data = data.subset(wavelength=request.wavelength)
-        if request.medium:
-            data = data.subset(medium=request.medium)
-        if request.category:
-            data = data.subset(category=request.category)
-
-        df = _build_table_df(data)
-
-        return EfficacyTableResponse(
-            columns=df.columns.tolist(),
-            rows=df.values.tolist(),
-            count=len(df)
-        )
+        filters = (request.wavelength, request.medium, request.category)
+        if response_format == "ndjson":
+            full_df = _get_full_table(request.fluence)
+            df = _build_table_df(_filter_rows(full_df, *filters))
+            return StreamingResponse(
+                iter_ndjson(_iter_table_records(df)),
+                media_type="application/x-ndjson",
+            )
+        return Response(_table_json(request.fluence, *filters), media_type="application/json")
 
     except ImportError as e:
         logger.error(f"guv_calcs efficacy module not available: {e}")
@@ -303,27 +452,28 @@ def get_efficacy_stats(request: EfficacyStatsRequest):
     Returns median, min, and max eACH-UV values for the filtered dataset.
     """
     try:
-        data = _get_inactivation_data(request.fluence)
-
-        # Apply filters (subset is non-mutating, returns new instance)
-        if request.wavelength:
-            data = data.subset(wavelength=request.wavelength)
-        data = data.subset(medium=request.medium)
-
-        df = data.table()
-
-        # Calculate eACH-UV for each pathogen using guv_calcs formula
+        # Only k1 is needed: mask that one column instead of selecting rows
+        # across the whole table, and reduce with the NaN-aware reductions
+        # rather than compacting out the NaNs first.
+        df = _get_full_table(request.fluence)
         k_col = "k1 [cm2/mJ]"
         if k_col in df.columns:
-            k_values = df[k_col].dropna()
-            if len(k_values) > 0:
-                each_values = eACH_UV(request.fluence, k_values)
-
+            mask = _row_mask(df, wavelength=request.wavelength, medium=request.medium)
+            k_values = df[k_col].to_numpy(dtype=np.float64)[mask]
+            count = int(np.count_nonzero(~np.isnan(k_values)))
+            if count > 0:
+                # eACH-UV (with k2 = f = 0) is linear in k1, so apply it to
+                # the reduced values instead of every element (min/max swap
+                # if fluence is negative).
+                ends = (
+                    eACH_UV(request.fluence, np.nanmin(k_values)),
+                    eACH_UV(request.fluence, np.nanmax(k_values)),
+                )
                 return EfficacyStatsResponse(
-                    each_uv_median=float(np.median(each_values)),
-                    each_uv_min=float(np.min(each_values)),
-                    each_uv_max=float(np.max(each_values)),
-                    pathogen_count=len(k_values),
+                    each_uv_median=float(eACH_UV(request.fluence, np.nanmedian(k_values))),
+                    each_uv_min=float(min(ends)),
+                    each_uv_max=float(max(ends)),
+                    pathogen_count=count,
                     wavelength=request.wavelength,
                     medium=request.medium
                 )
@@ -352,33 +502,11 @@ def get_explore_data(request: EfficacyExploreRequest):
     Consolidated endpoint for the Explore Data modal.
 
     Returns metadata (categories, mediums, wavelengths) and the full table
-    in a single response, avoiding 4 separate round-trips.
+    in a single response, avoiding 4 separate round-trips. The body is
+    cached per fluence.
     """
     try:
-        # Metadata via lightweight classmethods (no instantiation)
-        categories = InactivationData.get_valid_categories()
-        mediums = InactivationData.get_valid_mediums()
-        wavelengths = [int(w) for w in InactivationData.get_valid_wavelengths()]
-
-        # Table data via cached InactivationData (or base data without fluence)
-        if request.fluence is not None:
-            data = _get_inactivation_data(request.fluence)
-        else:
-            data = _get_base_inactivation_data()
-        df = _build_table_df(data)
-
-        table = EfficacyTableResponse(
-            columns=df.columns.tolist(),
-            rows=df.values.tolist(),
-            count=len(df)
-        )
-
-        return EfficacyExploreResponse(
-            categories=categories,
-            mediums=mediums,
-            wavelengths=wavelengths,
-            table=table
-        )
+        return Response(_explore_json(request.fluence), media_type="application/json")
 
     except ImportError as e:
         logger.error(f"guv_calcs efficacy module not available: {e}")
@@ -8,18 +8,29 @@ Lamp Types:
 
 from __future__ import annotations
 
-from typing import List, Optional, Dict, Any, Literal
+from typing import List, Optional, Dict, Any, Literal, NamedTuple
 from enum import Enum
 import io
+import os
+import asyncio
+import copy
 import base64
+import hashlib
+import struct
+import tempfile
 import threading
-from functools import lru_cache
+from pathlib import Path
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, update_wrapper
 import numpy as np
+import orjson
 import matplotlib
 matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 
-from fastapi import APIRouter, HTTPException, Query, Response, status
+from fastapi import APIRouter, HTTPException, Query, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel, Field
 
 from guv_calcs.lamp import Lamp  # type: ignore
@@ -28,17 +39,27 @@ from guv_calcs.units import convert_units  # type: ignore
 from guv_calcs.safety import PhotStandard  # type: ignore
 from guv_calcs.lamp.lamp_configs import resolve_keyword  # type: ignore
 
-from .utils import fig_to_base64, get_theme_colors, apply_theme
+from .utils import (fig_to_image, get_theme_colors, apply_theme, ImageFormat,
+                    IMAGE_CONTENT_TYPES, PLOT_LOCK, NumpyJSONResponse, ORJSONRoute)
+from .utils.triangulation import Delaunay, delaunay_simplices
+from .utils.serialization import dumps
 from .session_schemas import TlvLimits
 
 try:
-    from scipy.spatial import Delaunay
+    from scipy import __version__ as SCIPY_VERSION
 except ImportError:
-    Delaunay = None
+    SCIPY_VERSION = None
 
 from guv_calcs.lamp import get_valid_keys  # type: ignore
 
+try:
+    from guv_calcs import __version__ as GUV_CALCS_VERSION
+except ImportError:
+    GUV_CALCS_VERSION = "unknown"
+
 VALID_LAMPS = get_valid_keys()
+# Keys are lowercase already; the set gives hashed membership checks
+_VALID_LAMP_SET = frozenset(VALID_LAMPS)
 
 import logging
 logger = logging.getLogger(__name__)
@@ -49,24 +70,127 @@ logger = logging.getLogger(__name__)
 # ----------------------------
 REPORT_URLS: Dict[str, str] = {}
 
-def _init_report_urls():
-    """Probe report URLs once at import time, store results."""
+# Concurrent HEAD requests for the report probe
+_REPORT_PROBE_WORKERS = 8
+
+
+def _probe_report_url(lamp_key: str) -> Optional[str]:
+    """Return the lamp's report URL if it answers HEAD with 200, else None."""
     import urllib.request
-    for lamp_key in VALID_LAMPS:
-        url = f"https://reports.osluv.org/static/assay/{lamp_key}.html"
-        try:
-            req = urllib.request.Request(url, method='HEAD')
-            with urllib.request.urlopen(req, timeout=5) as response:
-                if response.status == 200:
-                    REPORT_URLS[lamp_key] = url
-        except Exception:
-            pass
+    url = f"https://reports.osluv.org/static/assay/{lamp_key}.html"
+    try:
+        req = urllib.request.Request(url, method='HEAD')
+        with urllib.request.urlopen(req, timeout=5) as response:
+            if response.status == 200:
+                return url
+    except Exception:
+        pass
+    return None
+
+
+def _init_report_urls():
+    """Probe report URLs once at import time, store results.
+
+    The probes are independent, so they run concurrently: the whole probe
+    takes about one round trip instead of one per lamp.
+    """
+    with ThreadPoolExecutor(max_workers=_REPORT_PROBE_WORKERS) as pool:
+        for lamp_key, url in zip(VALID_LAMPS, pool.map(_probe_report_url, VALID_LAMPS)):
+            if url is not None:
+                REPORT_URLS[lamp_key] = url
     logger.info(f"Report URL probe complete: {len(REPORT_URLS)}/{len(VALID_LAMPS)} reports available")
 
 # Run report URL probe in background thread at module load
 threading.Thread(target=_init_report_urls, daemon=True).start()
 
-lamp_router = APIRouter()
+lamp_router = APIRouter(route_class=ORJSONRoute)
+
+
+# ----------------------------
+# Request coalescing
+# ----------------------------
+# Calls currently running in the threadpool, keyed by (func, *args). Entries
+# are dropped as soon as the call finishes, so this only ever holds the
+# in-flight work; finished results live in the functions' own lru_caches.
+_inflight: Dict[tuple, asyncio.Future] = {}
+
+
+async def _single_flight(func, *args):
+    """Run func(*args) in the threadpool, sharing one call between concurrent callers.
+
+    Simultaneous requests for the same uncached preset would otherwise each
+    render it before any of them fills the cache.
+    """
+    key = (func, *args)
+    future = _inflight.get(key)
+    if future is None:
+        future = asyncio.ensure_future(run_in_threadpool(func, *args))
+        _inflight[key] = future
+        future.add_done_callback(lambda _: _inflight.pop(key, None))
+    # Shield so one caller disconnecting doesn't cancel the others' result
+    return await asyncio.shield(future)
+
+
+# ----------------------------
+# Byte-bounded memoization
+# ----------------------------
+class _BytesCacheInfo(NamedTuple):
+    currsize: int
+    currbytes: int
+    maxbytes: int
+
+
+class _BytesBoundedLRU:
+    """lru_cache-style memo bounded by the total size of its values, not their count.
+
+    ``sizeof`` measures each result; least recently used entries are evicted
+    until the total is back under ``max_bytes``, so adding a key dimension
+    can't silently multiply the memory the cache holds. A result larger than
+    the whole budget is returned without being cached.
+    """
+
+    def __init__(self, func, max_bytes: int, sizeof):
+        update_wrapper(self, func)
+        self._max_bytes = max_bytes
+        self._sizeof = sizeof
+        self._entries: OrderedDict = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, *args):
+        with self._lock:
+            entry = self._entries.get(args)
+            if entry is not None:
+                self._entries.move_to_end(args)
+                return entry[0]
+        value = self.__wrapped__(*args)
+        size = self._sizeof(value)
+        if size > self._max_bytes:
+            return value
+        with self._lock:
+            previous = self._entries.pop(args, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            self._entries[args] = (value, size)
+            self._bytes += size
+            while self._bytes > self._max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._bytes -= evicted
+        return value
+
+    def cache_info(self) -> _BytesCacheInfo:
+        with self._lock:
+            return _BytesCacheInfo(len(self._entries), self._bytes, self._max_bytes)
+
+    def cache_clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+
+def _bytes_lru(max_bytes: int, sizeof):
+    """Decorator form of _BytesBoundedLRU."""
+    return lambda func: _BytesBoundedLRU(func, max_bytes, sizeof)
 
 
 # ----------------------------
@@ -97,6 +221,12 @@ LAMP_DISPLAY_NAMES: Dict[str, str] = {
 # Special option for custom file upload
 CUSTOM_LAMP_KEY = "custom"
 
+# Display name for every preset, falling back to a title-cased key
+_PRESET_DISPLAY_NAMES: Dict[str, str] = {
+    lamp_key: LAMP_DISPLAY_NAMES.get(lamp_key, lamp_key.replace("_", " ").title())
+    for lamp_key in VALID_LAMPS
+}
+
 
 # ----------------------------
 # Schemas
@@ -135,7 +265,7 @@ def _build_presets() -> List[LampPresetInfo]:
     """Build presets list once. Called at module level after schema classes are defined."""
     presets = []
     for lamp_key in VALID_LAMPS:
-        display_name = LAMP_DISPLAY_NAMES.get(lamp_key, lamp_key.replace("_", " ").title())
+        display_name = _PRESET_DISPLAY_NAMES[lamp_key]
         placement_mode = None
         try:
             _, config = resolve_keyword(lamp_key)
@@ -155,42 +285,120 @@ def _build_presets() -> List[LampPresetInfo]:
 
 _PRESETS_222NM = _build_presets()
 
+_LAMP_TYPES = [
+    LampTypeInfo(
+        id="krcl_222",
+        name="Krypton chloride (222 nm)",
+        wavelength=222,
+        requires_custom_ies=False,
+        has_presets=True,
+    ),
+    LampTypeInfo(
+        id="lp_254",
+        name="Low-pressure mercury (254 nm)",
+        wavelength=254,
+        requires_custom_ies=True,
+        has_presets=False,
+    ),
+    LampTypeInfo(
+        id="other",
+        name="Other (custom wavelength)",
+        wavelength=0,
+        requires_custom_ies=True,
+        has_presets=False,
+    ),
+]
+
+_LAMP_PRESETS = [
+    *_PRESETS_222NM,
+    LampPresetInfo(
+        id=CUSTOM_LAMP_KEY,
+        name="Select local file...",
+        lamp_type="Krypton chloride (222 nm)",
+        wavelength=222,
+        has_ies=False,
+        has_spectrum=False,
+    ),
+]
+
+# The catalog is fixed once VALID_LAMPS is loaded, so serialize each body once;
+# the endpoints return these bytes and skip per-request model validation.
+_LAMP_TYPES_JSON = orjson.dumps([t.model_dump() for t in _LAMP_TYPES])
+_LAMP_PRESETS_JSON = orjson.dumps([p.model_dump() for p in _LAMP_PRESETS])
+_LAMP_OPTIONS_JSON = orjson.dumps(
+    LampSelectionOptions(lamp_types=_LAMP_TYPES, presets_222nm=_LAMP_PRESETS).model_dump()
+)
+
+
+# Preset detail bodies are fixed too; the endpoint is a dict lookup.
+_CUSTOM_DETAIL_JSON = orjson.dumps({
+    "id": CUSTOM_LAMP_KEY,
+    "name": "Custom lamp",
+    "description": "Upload your own .ies file and optionally a spectrum .csv file",
+    "lamp_type": "Krypton chloride (222 nm)",
+    "wavelength": 222,
+    "requires_ies_upload": True,
+    "requires_spectrum_upload": False,
+})
+_PRESET_DETAIL_JSON: Dict[str, bytes] = {
+    lamp_key: orjson.dumps({
+        "id": lamp_key,
+        "name": _PRESET_DISPLAY_NAMES[lamp_key],
+        "description": "Built-in 222nm KrCl lamp with pre-loaded IES and spectrum data",
+        "lamp_type": "Krypton chloride (222 nm)",
+        "wavelength": 222,
+        "load_method": "Lamp.from_keyword",
+        "requires_ies_upload": False,
+        "requires_spectrum_upload": False,
+    })
+    for lamp_key in VALID_LAMPS
+}
+
+
+def _etag(body: bytes) -> str:
+    return '"' + hashlib.blake2b(body, digest_size=8).hexdigest() + '"'
+
+
+_LAMP_TYPES_ETAG = _etag(_LAMP_TYPES_JSON)
+_LAMP_PRESETS_ETAG = _etag(_LAMP_PRESETS_JSON)
+_LAMP_OPTIONS_ETAG = _etag(_LAMP_OPTIONS_JSON)
+
+
+def _catalog_response(request: Request, body: bytes, etag: str) -> Response:
+    """Serve a pre-serialized catalog body, or 304 if the client's copy is current."""
+    headers = {"ETag": etag, "Cache-Control": "public, max-age=3600"}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        tags = {t.strip().removeprefix("W/") for t in if_none_match.split(",")}
+        if etag in tags or "*" in tags:
+            return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
 
 # ----------------------------
 # Endpoints
 # ----------------------------
 
+def _validated_preset(preset_id: str) -> str:
+    """Return the lowercased preset key, or raise 404 if it isn't a preset."""
+    preset_id_lower = preset_id.lower()
+    if preset_id_lower not in _VALID_LAMP_SET:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Preset '{preset_id}' not found. Valid presets: {VALID_LAMPS}"
+        )
+    return preset_id_lower
+
+
 @lamp_router.get(
     "/lamps/types",
     summary="Get available lamp types",
     description="Returns the available lamp types and their requirements.",
     response_model=List[LampTypeInfo],
 )
-def get_lamp_types():
+def get_lamp_types(request: Request):
     """Get the available lamp types."""
-    return [
-        LampTypeInfo(
-            id="krcl_222",
-            name="Krypton chloride (222 nm)",
-            wavelength=222,
-            requires_custom_ies=False,
-            has_presets=True,
-        ),
-        LampTypeInfo(
-            id="lp_254",
-            name="Low-pressure mercury (254 nm)",
-            wavelength=254,
-            requires_custom_ies=True,
-            has_presets=False,
-        ),
-        LampTypeInfo(
-            id="other",
-            name="Other (custom wavelength)",
-            wavelength=0,
-            requires_custom_ies=True,
-            has_presets=False,
-        ),
-    ]
+    return _catalog_response(request, _LAMP_TYPES_JSON, _LAMP_TYPES_ETAG)
 
 
 @lamp_router.get(
@@ -203,19 +411,9 @@ def get_lamp_types():
     ),
     response_model=List[LampPresetInfo],
 )
-def get_lamp_presets():
+def get_lamp_presets(request: Request):
     """Get the available built-in 222nm lamp presets."""
-    return [
-        *_PRESETS_222NM,
-        LampPresetInfo(
-            id=CUSTOM_LAMP_KEY,
-            name="Select local file...",
-            lamp_type="Krypton chloride (222 nm)",
-            wavelength=222,
-            has_ies=False,
-            has_spectrum=False,
-        ),
-    ]
+    return _catalog_response(request, _LAMP_PRESETS_JSON, _LAMP_PRESETS_ETAG)
 
 
 @lamp_router.get(
@@ -227,12 +425,9 @@ def get_lamp_presets():
     ),
     response_model=LampSelectionOptions,
 )
-def get_lamp_options():
+def get_lamp_options(request: Request):
     """Get all lamp selection options for UI population."""
-    return LampSelectionOptions(
-        lamp_types=get_lamp_types(),
-        presets_222nm=get_lamp_presets(),
-    )
+    return _catalog_response(request, _LAMP_OPTIONS_JSON, _LAMP_OPTIONS_ETAG)
 
 
 @lamp_router.get(
@@ -243,44 +438,41 @@ def get_lamp_options():
 def get_preset_details(preset_id: str):
     """Get details about a specific lamp preset."""
     if preset_id == CUSTOM_LAMP_KEY:
-        return {
-            "id": CUSTOM_LAMP_KEY,
-            "name": "Custom lamp",
-            "description": "Upload your own .ies file and optionally a spectrum .csv file",
-            "lamp_type": "Krypton chloride (222 nm)",
-            "wavelength": 222,
-            "requires_ies_upload": True,
-            "requires_spectrum_upload": False,
-        }
-
-    if preset_id.lower() not in VALID_LAMPS:
-        raise HTTPException(
-            status_code=404,
-            detail=f"Preset '{preset_id}' not found. Valid presets: {VALID_LAMPS}"
-        )
+        return Response(content=_CUSTOM_DETAIL_JSON, media_type="application/json")
+    preset_id_lower = _validated_preset(preset_id)
+    return Response(content=_PRESET_DETAIL_JSON[preset_id_lower], media_type="application/json")
 
-    display_name = LAMP_DISPLAY_NAMES.get(preset_id.lower(), preset_id.replace("_", " ").title())
 
-    return {
-        "id": preset_id.lower(),
-        "name": display_name,
-        "description": f"Built-in 222nm KrCl lamp with pre-loaded IES and spectrum data",
-        "lamp_type": "Krypton chloride (222 nm)",
-        "wavelength": 222,
-        "load_method": "Lamp.from_keyword",
-        "requires_ies_upload": False,
-        "requires_spectrum_upload": False,
-    }
+@lamp_router.head(
+    "/lamps/presets/{preset_id}",
+    summary="Check that a preset exists",
+    description=(
+        "Cheap existence probe: 200 if the preset (or 'custom') is known, 404 "
+        "otherwise, with no body. Prefer this over validate-preset for checks."
+    ),
+    responses={404: {"description": "Preset not found"}},
+)
+def head_preset(preset_id: str) -> Response:
+    """Report whether a preset exists without building a body."""
+    found = preset_id == CUSTOM_LAMP_KEY or preset_id.lower() in _VALID_LAMP_SET
+    # The preset list is fixed at import time, so the answer is cacheable
+    return Response(
+        status_code=200 if found else 404,
+        headers={"Cache-Control": "public, max-age=3600"},
+    )
 
 
 @lamp_router.get(
     "/lamps/validate-preset/{preset_id}",
     summary="Validate a preset ID",
-    description="Check if a preset ID is valid and can be used with Lamp.from_keyword.",
+    description=(
+        "Check if a preset ID is valid and can be used with Lamp.from_keyword. "
+        "For a plain existence check, HEAD /lamps/presets/{preset_id} is cheaper."
+    ),
 )
 def validate_preset(preset_id: str):
     """Validate that a preset ID exists."""
-    is_valid = preset_id.lower() in VALID_LAMPS
+    is_valid = preset_id.lower() in _VALID_LAMP_SET
     return {
         "preset_id": preset_id,
         "valid": is_valid,
@@ -313,27 +505,70 @@ class PhotometricWebResponse(BaseModel):
     color: str = Field(description="Suggested color for the lamp mesh")
 
 
+@lru_cache(maxsize=len(VALID_LAMPS))
+def _preset_web_lamp(preset_id: str) -> Lamp:
+    """Preset lamp at the origin aimed down (-Z), loaded once per preset.
+
+    Treat as read-only: callers that adjust the source take a deepcopy,
+    which is several times cheaper than re-parsing the IES and spectrum.
+    """
+    return Lamp.from_keyword(
+        preset_id,
+        x=0, y=0, z=0,
+        aimx=0, aimy=0, aimz=-1,
+    )
+
+
+@lru_cache(maxsize=len(VALID_LAMPS))
+def _preset_simplices(preset_id: str) -> np.ndarray:
+    """Delaunay triangulation of a preset's photometric angles.
+
+    The angles come from the IES grid alone, so one triangulation serves
+    every source setting, units choice and scaling factor for the preset.
+    Persisted under LAMP_INFO_CACHE_DIR like the preset info renders; the
+    set of presets is fixed, so the directory stays bounded.
+    """
+    path = _preset_simplices_cache_path(preset_id)
+    if path is not None:
+        try:
+            simplices = np.load(path)
+            simplices.setflags(write=False)
+            return simplices
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable triangulation cache file {path}: {e}")
+
+    lamp = _preset_web_lamp(preset_id)
+    # to_polar returns one (3, N) array; its theta/phi rows transposed are
+    # the (N, 2) Delaunay input, made contiguous with a single copy
+    theta_phi = np.ascontiguousarray(to_polar(*lamp.photometric_coords.T)[:2].T)
+    simplices = delaunay_simplices(theta_phi)
+    if path is not None:
+        buf = io.BytesIO()
+        np.save(buf, simplices)
+        _write_cache_file(path, buf.getvalue())
+    return simplices
+
+
 @lru_cache(maxsize=64)
-def _compute_photometric_web(
+def _compute_photometric_topology(
     preset_id: str,
-    scaling_factor: float,
     source_density: Optional[int],
     source_width: Optional[float],
     source_length: Optional[float],
     units: str = "meters",
 ) -> dict:
-    """Compute photometric web data for a preset lamp. Cached by arguments.
-
-    source_width/source_length are expected in the caller's units.
-    If units="feet", inputs are converted to meters for the lamp, and all
-    spatial outputs are converted back to feet.
+    """Compute the scale-independent photometric web data for a preset lamp.
+
+    A lamp's scaling_factor multiplies both its intensity values and its
+    total power, so the web's shape, triangulation, surface points and
+    fixture bounds don't depend on it and the vertices are linear in it.
+    Everything here is built at scaling_factor=1 and cached, so a new
+    scaling factor never re-runs the lamp load or Delaunay; the vertices
+    are returned as a read-only (N, 3) array for the caller to scale.
     """
-    lamp = Lamp.from_keyword(
-        preset_id,
-        x=0, y=0, z=0,
-        aimx=0, aimy=0, aimz=-1,
-        scaling_factor=scaling_factor,
-    )
+    lamp = copy.deepcopy(_preset_web_lamp(preset_id))
 
     # Convert input dimensions from caller's units to meters (lamp's native units)
     input_factor = 0.3048 if units == "feet" else 1.0
@@ -348,28 +583,29 @@ def _compute_photometric_web(
     init_scale = lamp.values.max()
     coords = lamp.transform_to_world(lamp.photometric_coords, scale=init_scale)
     power_scale = lamp.get_total_power() / 100.0
-    coords = (coords.T - lamp.position) * power_scale
-    x, y, z = coords.T
 
-    Theta, Phi, R = to_polar(*lamp.photometric_coords.T)
-    tri = Delaunay(np.column_stack((Theta.flatten(), Phi.flatten())))
+    simplices = _preset_simplices(preset_id)
 
     # Unit conversion factor: the lamp is always created in meters, so
     # convert all spatial outputs to the requested units.
     uf = 1.0 / 0.3048 if units == "feet" else 1.0
 
-    vertices = [[float(x[i] * uf), float(y[i] * uf), float(z[i] * uf)] for i in range(len(x))]
-    triangles = [[int(tri.simplices[i, 0]), int(tri.simplices[i, 1]), int(tri.simplices[i, 2])]
-                 for i in range(len(tri.simplices))]
+    # transform_to_world returns (3, N); build the (N, 3) vertex array in one
+    # broadcast instead of indexing three strided per-axis views. Kept
+    # C-contiguous so the scaled copies can be encoded straight by orjson.
+    vertices = np.ascontiguousarray((coords.T - lamp.position) * power_scale * uf)
+    vertices.setflags(write=False)
+    triangles = simplices.tolist()
     aim_line = [[0.0, 0.0, 0.0], [0.0, 0.0, -1.0 * uf]]
 
     try:
         raw_surface_points = lamp.surface.surface_points
         if raw_surface_points is not None and len(raw_surface_points) > 0:
-            if raw_surface_points.ndim == 1:
-                surface_points = [[float(v * uf) for v in raw_surface_points.tolist()]]
+            scaled_points = (np.asarray(raw_surface_points, dtype=np.float64) * uf)
+            if scaled_points.ndim == 1:
+                surface_points = [scaled_points.tolist()]
             else:
-                surface_points = [[float(p[0] * uf), float(p[1] * uf), float(p[2] * uf)] for p in raw_surface_points]
+                surface_points = scaled_points[:, :3].tolist()
         else:
             surface_points = [[0.0, 0.0, 0.0]]
     except Exception as e:
@@ -380,7 +616,7 @@ def _compute_photometric_web(
     try:
         if lamp.fixture.has_dimensions:
             corners = lamp.geometry.get_bounding_box_corners()
-            fixture_bounds = [[float(c[0] * uf), float(c[1] * uf), float(c[2] * uf)] for c in corners]
+            fixture_bounds = (np.asarray(corners, dtype=np.float64)[:, :3] * uf).tolist()
     except Exception as e:
         logger.warning(f"Failed to get fixture bounds for {preset_id}: {e}")
 
@@ -394,6 +630,45 @@ def _compute_photometric_web(
     }
 
 
+def _photometric_web_preset(request: PhotometricWebRequest) -> str:
+    """Return the lowercased preset key, or raise if a web can't be built for it."""
+    if Delaunay is None:
+        raise HTTPException(
+            status_code=500,
+            detail="scipy is required for photometric web visualization"
+        )
+
+    preset_id = request.preset_id.lower()
+    if preset_id not in _VALID_LAMP_SET:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid preset_id '{preset_id}'. Valid options: {VALID_LAMPS}"
+        )
+    return preset_id
+
+
+@lru_cache(maxsize=64)
+def _compute_photometric_web(
+    preset_id: str,
+    scaling_factor: float,
+    source_density: Optional[int],
+    source_width: Optional[float],
+    source_length: Optional[float],
+    units: str = "meters",
+) -> bytes:
+    """Compute the photometric web JSON body for a preset lamp. Cached by arguments.
+
+    source_width/source_length are expected in the caller's units.
+    If units="feet", inputs are converted to meters for the lamp, and all
+    spatial outputs are converted back to feet. The cache holds the encoded
+    body, so a repeat request is served without touching the mesh again.
+    """
+    topology = _compute_photometric_topology(
+        preset_id, source_density, source_width, source_length, units
+    )
+    return dumps({**topology, "vertices": topology["vertices"] * scaling_factor})
+
+
 @lamp_router.post(
     "/lamps/photometric-web",
     summary="Get photometric web data for a preset lamp",
@@ -405,23 +680,83 @@ def _compute_photometric_web(
     ),
     response_model=PhotometricWebResponse,
 )
-def get_preset_photometric_web(request: PhotometricWebRequest):
+async def get_preset_photometric_web(request: PhotometricWebRequest):
     """Get photometric web mesh data for a preset lamp (centered at origin)."""
-    if Delaunay is None:
-        raise HTTPException(
-            status_code=500,
-            detail="scipy is required for photometric web visualization"
+    preset_id = _photometric_web_preset(request)
+
+    try:
+        body = await _single_flight(
+            _compute_photometric_web,
+            preset_id,
+            request.scaling_factor,
+            request.source_density,
+            request.source_width,
+            request.source_length,
+            request.units,
         )
+        # The cached body is already well-formed JSON; returning it as-is
+        # skips re-validating and re-encoding thousands of vertices on every
+        # request. response_model still documents the schema.
+        return Response(content=body, media_type="application/json")
 
-    preset_id = request.preset_id.lower()
-    if preset_id not in VALID_LAMPS:
+    except Exception as e:
+        logger.error(f"Failed to compute photometric web for preset {preset_id}: {e}")
         raise HTTPException(
-            status_code=400,
-            detail=f"Invalid preset_id '{preset_id}'. Valid options: {VALID_LAMPS}"
+            status_code=500,
+            detail=f"Failed to compute photometric web: {str(e)}"
         )
 
+
+# Binary mesh layout: little-endian uint32 vertex count and triangle count,
+# then the vertices as float32 [x, y, z] triples, then the triangles as
+# uint32 [i, j, k] triples. Both buffers start on a 4-byte boundary, so a
+# client can view them in place as Float32Array(buf, 8, 3 * nVerts) and
+# Uint32Array(buf, 8 + 12 * nVerts, 3 * nTris).
+_MESH_HEADER = struct.Struct("<II")
+
+
+@lru_cache(maxsize=64)
+def _compute_photometric_web_binary(
+    preset_id: str,
+    scaling_factor: float,
+    source_density: Optional[int],
+    source_width: Optional[float],
+    source_length: Optional[float],
+    units: str = "meters",
+) -> bytes:
+    """Encode the photometric web mesh in the binary layout above. Cached by arguments."""
+    topology = _compute_photometric_topology(
+        preset_id, source_density, source_width, source_length, units
+    )
+    vertices = (topology["vertices"] * scaling_factor).astype("<f4")
+    triangles = np.asarray(topology["triangles"], dtype="<u4")
+    return (
+        _MESH_HEADER.pack(len(vertices), len(triangles))
+        + vertices.tobytes()
+        + triangles.tobytes()
+    )
+
+
+@lamp_router.post(
+    "/lamps/photometric-web.bin",
+    summary="Get the photometric web mesh for a preset lamp as binary buffers",
+    description=(
+        "Same mesh as /lamps/photometric-web, packed for direct upload to a "
+        "GPU buffer: a little-endian uint32 vertex count and triangle count, "
+        "then float32 [x, y, z] vertices, then uint32 [i, j, k] triangle "
+        "indices. Only the mesh is included; fetch the JSON endpoint for the "
+        "aim line, surface points and fixture bounds."
+    ),
+    response_class=Response,
+    responses={200: {"content": {"application/octet-stream": {}}}},
+)
+async def get_preset_photometric_web_binary(request: PhotometricWebRequest):
+    """Get the photometric web mesh as packed float32/uint32 buffers."""
+    preset_id = _photometric_web_preset(request)
+
     try:
-        data = _compute_photometric_web(
+        body = await _single_flight(
+            _compute_photometric_web_binary,
             preset_id,
             request.scaling_factor,
             request.source_density,
@@ -429,7 +764,7 @@ def get_preset_photometric_web(request: PhotometricWebRequest):
             request.source_length,
             request.units,
         )
-        return PhotometricWebResponse(**data)
+        return Response(content=body, media_type="application/octet-stream")
 
     except Exception as e:
         logger.error(f"Failed to compute photometric web for preset {preset_id}: {e}")
@@ -450,8 +785,8 @@ class LampInfoResponse(BaseModel):
     total_power_mw: float
     tlv_acgih: TlvLimits
     tlv_icnirp: TlvLimits
-    photometric_plot_base64: str  # PNG as base64
-    spectrum_plot_base64: Optional[str] = None  # PNG as base64, None if no spectrum
+    photometric_plot_base64: str  # Image as base64 (PNG unless another format was requested)
+    spectrum_plot_base64: Optional[str] = None  # Image as base64, None if no spectrum
     spectrum_linear_plot_base64: Optional[str] = None
     spectrum_log_plot_base64: Optional[str] = None
     has_spectrum: bool
@@ -461,10 +796,20 @@ class LampInfoResponse(BaseModel):
     spectrum_plot_hires_base64: Optional[str] = None
     spectrum_linear_plot_hires_base64: Optional[str] = None
     spectrum_log_plot_hires_base64: Optional[str] = None
+    content_type: str = "image/png"  # MIME type of every *_base64 image above
 
 
-def _generate_photometric_plot(lamp, theme, dpi):
-    """Generate photometric polar plot for a lamp."""
+def _plot_image(fig, image_format: ImageFormat, dpi: int, bg_color: str) -> str:
+    """Save a preset plot figure as base64, leaving the figure open."""
+    return fig_to_image(fig, image_format, dpi=dpi, facecolor=bg_color, edgecolor='none',
+                        bbox_inches='tight', pad_inches=0.1)["image_base64"]
+
+
+def _generate_photometric_plots(lamp, theme, dpis, image_format: ImageFormat = "png"):
+    """Generate the photometric polar plot for a lamp at each of ``dpis``.
+
+    The figure is built once and saved per DPI; only the raster size differs.
+    """
     # Brighter line colors for dark backgrounds
     DARK_LINE_REMAP = {
         'red': '#ff6b6b',
@@ -475,80 +820,203 @@ def _generate_photometric_plot(lamp, theme, dpi):
     bg_color = colors['bg_color']
     is_dark = theme != 'light'
     fig = None
-    try:
-        result = lamp.plot_ies()
-        fig = result[0] if isinstance(result, tuple) else result
-        apply_theme(fig, theme, grid=True)
-        if is_dark:
-            for ax in fig.axes:
-                for line in ax.get_lines():
-                    orig = line.get_color()
-                    if orig in DARK_LINE_REMAP:
-                        line.set_color(DARK_LINE_REMAP[orig])
-        return fig_to_base64(fig, dpi=dpi, facecolor=bg_color,
-                             bbox_inches='tight', pad_inches=0.1)
-    except Exception as e:
-        logger.warning(f"Failed to generate photometric plot: {e}")
-        return ""
-    finally:
-        if fig is not None:
-            plt.close(fig)
-
-
-def _generate_spectrum_plot(lamp, scale, theme, dpi):
-    """Generate spectrum plot for a lamp at given scale."""
+    with PLOT_LOCK:
+        try:
+            result = lamp.plot_ies()
+            fig = result[0] if isinstance(result, tuple) else result
+            apply_theme(fig, theme, grid=True)
+            if is_dark:
+                for ax in fig.axes:
+                    for line in ax.get_lines():
+                        orig = line.get_color()
+                        if orig in DARK_LINE_REMAP:
+                            line.set_color(DARK_LINE_REMAP[orig])
+            return [_plot_image(fig, image_format, dpi, bg_color) for dpi in dpis]
+        except Exception as e:
+            logger.warning(f"Failed to generate photometric plot: {e}")
+            return ["" for _ in dpis]
+        finally:
+            if fig is not None:
+                plt.close(fig)
+
+
+def _generate_spectrum_plots(lamp, theme, dpis, image_format: ImageFormat = "png"):
+    """Generate (linear, log) spectrum plots for a lamp at each of ``dpis``.
+
+    Only the y scale and raster size differ between the images, so the figure
+    is built once, saved per DPI, then re-autoscaled after switching to log
+    and saved again, instead of being plotted for every variant.
+    """
     colors = get_theme_colors(theme)
     bg_color = colors['bg_color']
     fig = None
+
+    def save_all(fig):
+        return [_plot_image(fig, image_format, dpi, bg_color) for dpi in dpis]
+
+    with PLOT_LOCK:
+        try:
+            result = lamp.spectrum.plot(weights=True, yscale='linear')
+            fig = result[0] if isinstance(result, tuple) else result
+            apply_theme(fig, theme, grid=True)
+            linear = save_all(fig)
+            for ax in fig.axes:
+                ax.set_yscale('log')
+                ax.autoscale(axis='y')
+            log = save_all(fig)
+            return linear, log
+        except Exception as e:
+            logger.warning(f"Failed to generate spectrum plots: {e}")
+            return [None for _ in dpis], [None for _ in dpis]
+        finally:
+            if fig is not None:
+                plt.close(fig)
+
+
+# ----------------------------
+# Preset lamp info disk cache
+# ----------------------------
+# Rendered preset info is persisted so restarts skip matplotlib entirely.
+# Set LAMP_INFO_CACHE_DIR to relocate it, or to an empty string to disable.
+_LAMP_INFO_CACHE_FORMAT = 2  # Bump when the plots or the dict layout change
+
+
+def _default_lamp_info_cache_dir() -> str:
+    base = os.getenv("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "illuminate", "lamp_info")
+
+
+LAMP_INFO_CACHE_DIR = os.getenv("LAMP_INFO_CACHE_DIR", _default_lamp_info_cache_dir())
+
+
+def _lamp_info_cache_path(
+    preset_id: str, theme: str, include_hires: bool, image_format: ImageFormat
+) -> Optional[Path]:
+    """Disk location for one preset info entry, or None if the cache is disabled."""
+    if not LAMP_INFO_CACHE_DIR:
+        return None
+    key = (preset_id, theme, include_hires, image_format, GUV_CALCS_VERSION,
+           matplotlib.__version__, _LAMP_INFO_CACHE_FORMAT)
+    digest = hashlib.sha1(repr(key).encode()).hexdigest()
+    return Path(LAMP_INFO_CACHE_DIR) / f"{digest}.json"
+
+
+def _preset_simplices_cache_path(preset_id: str) -> Optional[Path]:
+    """Disk location for a preset's triangulation, or None if the cache is disabled."""
+    if not LAMP_INFO_CACHE_DIR:
+        return None
+    key = (preset_id, GUV_CALCS_VERSION, SCIPY_VERSION)
+    digest = hashlib.sha1(repr(key).encode()).hexdigest()
+    return Path(LAMP_INFO_CACHE_DIR) / f"tri_{digest}.npy"
+
+
+def _load_lamp_info(path: Path) -> Optional[dict]:
     try:
-        result = lamp.spectrum.plot(weights=True, yscale=scale)
-        fig = result[0] if isinstance(result, tuple) else result
-        apply_theme(fig, theme, grid=True)
-        return fig_to_base64(fig, dpi=dpi, facecolor=bg_color,
-                             bbox_inches='tight', pad_inches=0.1)
-    except Exception as e:
-        logger.warning(f"Failed to generate spectrum plot ({scale}): {e}")
+        return orjson.loads(path.read_bytes())
+    except FileNotFoundError:
+        return None
+    except (OSError, orjson.JSONDecodeError) as e:
+        logger.warning(f"Ignoring unreadable lamp info cache file {path}: {e}")
         return None
-    finally:
-        if fig is not None:
-            plt.close(fig)
 
 
-@lru_cache(maxsize=128)
-def _generate_preset_lamp_info(preset_id: str, theme: str, include_hires: bool) -> dict:
+def _write_cache_file(path: Path, payload: bytes) -> None:
+    """Write atomically so a concurrent reader never sees a partial file."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError as e:
+        logger.warning(f"Could not write lamp info cache file {path}: {e}")
+
+
+def _lamp_info_bytes(info: dict) -> int:
+    """Size of a preset info entry: the length of its base64 image fields."""
+    return sum(len(v) for k, v in info.items() if k.endswith("_base64") and v)
+
+
+# Bounded by the base64 it holds rather than by entry count, so the format
+# dimension can't multiply it. Hi-res entries measure ~1.8 MB as PNG, ~1.1 MB
+# as SVG and ~0.9 MB as WebP, so 80 MB keeps every preset's light and dark
+# hi-res PNG (~40 MB) plus a good share of other combinations in memory;
+# anything evicted is re-read from the disk cache, not re-rendered.
+PRESET_INFO_CACHE_BYTES = 80 * 1024 * 1024
+
+
+@_bytes_lru(max_bytes=PRESET_INFO_CACHE_BYTES, sizeof=_lamp_info_bytes)
+def _generate_preset_lamp_info(
+    preset_id: str, theme: str, include_hires: bool, image_format: ImageFormat = "png"
+) -> dict:
     """Generate and cache preset lamp info. Returns a dict matching LampInfoResponse fields.
 
-    Keyed by (preset_id, theme, include_hires). Both spectrum scales are always
-    generated so toggling is instant on the client.
+    Keyed by (preset_id, theme, include_hires, image_format). Both spectrum scales are always
+    generated so toggling is instant on the client. Callers pass a normalized
+    theme ('light' or 'dark') so unknown values cannot grow the cache.
+
+    Renders are also persisted under LAMP_INFO_CACHE_DIR; the report URL is
+    probed per process, so it is refreshed rather than read back from disk.
+    """
+    path = _lamp_info_cache_path(preset_id, theme, include_hires, image_format)
+    if path is not None:
+        info = _load_lamp_info(path)
+        if info is not None:
+            info["report_url"] = REPORT_URLS.get(preset_id)
+            return info
+
+    info = _render_preset_lamp_info(preset_id, theme, include_hires, image_format)
+    # Failed renders come back empty; leave those for the next process to retry
+    rendered = bool(info["photometric_plot_base64"]) and (
+        not info["has_spectrum"] or bool(info["spectrum_log_plot_base64"])
+    )
+    if path is not None and rendered:
+        _write_cache_file(path, orjson.dumps(info))
+    return info
+
+
+@lru_cache(maxsize=len(VALID_LAMPS))
+def _preset_physics(preset_id: str) -> tuple:
+    """Theme-independent values for a preset: total power, ACGIH and ICNIRP TLVs.
+
+    Shared by every (theme, include_hires, format) info entry of the preset.
     """
     lamp = Lamp.from_keyword(preset_id)
-    display_name = LAMP_DISPLAY_NAMES.get(preset_id, preset_id.replace("_", " ").title())
+    return (
+        lamp.get_total_power(),
+        lamp.get_tlvs(PhotStandard.ACGIH),
+        lamp.get_tlvs(PhotStandard.ICNIRP),
+    )
+
 
-    total_power = lamp.get_total_power()
+def _render_preset_lamp_info(
+    preset_id: str, theme: str, include_hires: bool, image_format: ImageFormat = "png"
+) -> dict:
+    """Render the plots and photobiological limits for one preset lamp."""
+    lamp = Lamp.from_keyword(preset_id)
+    display_name = _PRESET_DISPLAY_NAMES[preset_id]
 
-    acgih_skin, acgih_eye = lamp.get_tlvs(PhotStandard.ACGIH)
-    icnirp_skin, icnirp_eye = lamp.get_tlvs(PhotStandard.ICNIRP)
+    total_power, (acgih_skin, acgih_eye), (icnirp_skin, icnirp_eye) = _preset_physics(preset_id)
 
-    # Generate photometric plot at 150 DPI
-    photometric_plot = _generate_photometric_plot(lamp, theme, 150)
+    # 150 DPI images, plus 300 DPI versions from the same figures if requested
+    dpis = [150, 300] if include_hires else [150]
+    photometric = _generate_photometric_plots(lamp, theme, dpis, image_format)
+    photometric_plot = photometric[0]
+    photometric_hires = photometric[1] if include_hires else None
 
-    # Generate both spectrum scales at 150 DPI
+    # Both spectrum scales, from one figure
     has_spectrum = lamp.spectrum is not None
-    spectrum_linear = None
-    spectrum_log = None
+    spectrum_linear = spectrum_log = None
+    spectrum_linear_hires = spectrum_log_hires = None
     if has_spectrum:
-        spectrum_linear = _generate_spectrum_plot(lamp, 'linear', theme, 150)
-        spectrum_log = _generate_spectrum_plot(lamp, 'log', theme, 150)
-
-    # Hi-res (300 DPI) versions
-    photometric_hires = None
-    spectrum_linear_hires = None
-    spectrum_log_hires = None
-    if include_hires:
-        photometric_hires = _generate_photometric_plot(lamp, theme, 300)
-        if has_spectrum:
-            spectrum_linear_hires = _generate_spectrum_plot(lamp, 'linear', theme, 300)
-            spectrum_log_hires = _generate_spectrum_plot(lamp, 'log', theme, 300)
+        linear, log = _generate_spectrum_plots(lamp, theme, dpis, image_format)
+        spectrum_linear, spectrum_log = linear[0], log[0]
+        if include_hires:
+            spectrum_linear_hires, spectrum_log_hires = linear[1], log[1]
 
     report_url = REPORT_URLS.get(preset_id)
 
@@ -574,21 +1042,32 @@ def _generate_preset_lamp_info(preset_id: str, theme: str, include_hires: bool)
         "spectrum_plot_hires_base64": spectrum_log_hires,
         "spectrum_linear_plot_hires_base64": spectrum_linear_hires,
         "spectrum_log_plot_hires_base64": spectrum_log_hires,
+        "content_type": IMAGE_CONTENT_TYPES[image_format],
     }
 
 
 def _prewarm_cache():
-    """Pre-generate all preset lamp info combinations in background."""
-    for preset_id in VALID_LAMPS:
-        for t in ('dark', 'light'):
+    """Pre-generate all preset lamp info combinations in background.
+
+    Renders serialize on PLOT_LOCK (pyplot isn't thread-safe), so this stays
+    one thread; after the first run it mostly reads the disk cache. It warms
+    every preset in the default dark theme before any light-theme renders so
+    the common case is ready first.
+    """
+    for t in ('dark', 'light'):
+        for preset_id in VALID_LAMPS:
             try:
-                _generate_preset_lamp_info(preset_id, t, True)
+                # Same argument tuple as get_lamp_info, so requests hit this entry
+                _generate_preset_lamp_info(preset_id, t, True, "png")
             except Exception as e:
                 logger.warning(f"Cache pre-warm failed for {preset_id}/{t}: {e}")
     logger.info("Preset lamp info cache pre-warm complete")
 
-# Pre-warm cache in background thread at module load
-threading.Thread(target=_prewarm_cache, daemon=True).start()
+# Pre-warm cache in background thread at module load. Set PREWARM_LAMP_INFO=false
+# for short-lived processes (CLI use, tests) that would never use the renders.
+PREWARM_LAMP_INFO = os.getenv("PREWARM_LAMP_INFO", "true").lower() == "true"
+if PREWARM_LAMP_INFO:
+    threading.Thread(target=_prewarm_cache, daemon=True).start()
 
 
 @lamp_router.get(
@@ -601,29 +1080,31 @@ threading.Thread(target=_prewarm_cache, daemon=True).start()
     ),
     response_model=LampInfoResponse,
 )
-def get_lamp_info(
+async def get_lamp_info(
     preset_id: str,
     spectrum_scale: str = Query("log", description="Y-axis scale for spectrum plot: 'linear' or 'log' (sets spectrum_plot_base64)"),
     theme: str = Query("dark", description="Color theme for plots: 'light' or 'dark'"),
     dpi: int = Query(150, description="Ignored (kept for backward compat). Both 150 and 300 DPI are always returned."),
     include_hires: bool = Query(True, description="Include 300 DPI hi-res versions"),
-) -> LampInfoResponse:
+    image_format: ImageFormat = Query("png", alias="format", description="Plot image format; WebP is several times smaller than PNG"),
+):
     """Get complete lamp information including plots."""
-    preset_id_lower = preset_id.lower()
-    if preset_id_lower not in VALID_LAMPS:
-        raise HTTPException(
-            status_code=404,
-            detail=f"Preset '{preset_id}' not found. Valid presets: {VALID_LAMPS}"
-        )
+    preset_id_lower = _validated_preset(preset_id)
 
     try:
-        data = _generate_preset_lamp_info(preset_id_lower, theme, include_hires)
+        # Anything other than 'light' renders dark; collapse it to one cache key
+        theme = 'light' if theme == 'light' else 'dark'
+        data = await _single_flight(
+            _generate_preset_lamp_info, preset_id_lower, theme, include_hires, image_format
+        )
         # Set spectrum_plot_base64 based on requested scale for backward compat
         result = dict(data)
         if spectrum_scale == 'linear' and result.get('spectrum_linear_plot_base64'):
             result['spectrum_plot_base64'] = result['spectrum_linear_plot_base64']
             result['spectrum_plot_hires_base64'] = result.get('spectrum_linear_plot_hires_base64')
-        return LampInfoResponse(**result)
+        # Built by our own cached renderer, so skip re-validating megabytes of
+        # base64 through the model; response_model still documents the schema.
+        return NumpyJSONResponse(result)
     except HTTPException:
         raise
     except Exception as e:
@@ -634,6 +1115,19 @@ def get_lamp_info(
         )
 
 
+# Preset files never change at runtime, so serve the serialized bytes from
+# memory instead of re-parsing the lamp on every download (largest is ~170 KB).
+@lru_cache(maxsize=len(VALID_LAMPS))
+def _preset_ies_bytes(preset_id: str) -> bytes:
+    return Lamp.from_keyword(preset_id).save_ies(original=True)
+
+
+@lru_cache(maxsize=len(VALID_LAMPS))
+def _preset_spectrum_csv(preset_id: str) -> Optional[bytes]:
+    spectrum = Lamp.from_keyword(preset_id).spectrum
+    return spectrum.to_csv() if spectrum is not None else None
+
+
 @lamp_router.get(
     "/lamps/download/ies/{preset_id}",
     summary="Download IES file for a preset lamp",
@@ -641,16 +1135,10 @@ def get_lamp_info(
 )
 def download_lamp_ies(preset_id: str) -> Response:
     """Download IES file for a preset lamp."""
-    preset_id_lower = preset_id.lower()
-    if preset_id_lower not in VALID_LAMPS:
-        raise HTTPException(
-            status_code=404,
-            detail=f"Preset '{preset_id}' not found. Valid presets: {VALID_LAMPS}"
-        )
+    preset_id_lower = _validated_preset(preset_id)
 
     try:
-        lamp = Lamp.from_keyword(preset_id_lower)
-        ies_bytes = lamp.save_ies(original=True)
+        ies_bytes = _preset_ies_bytes(preset_id_lower)
 
         return Response(
             content=ies_bytes,
@@ -672,24 +1160,17 @@ def download_lamp_ies(preset_id: str) -> Response:
 )
 def download_lamp_spectrum(preset_id: str) -> Response:
     """Download spectrum CSV for a preset lamp."""
-    preset_id_lower = preset_id.lower()
-    if preset_id_lower not in VALID_LAMPS:
-        raise HTTPException(
-            status_code=404,
-            detail=f"Preset '{preset_id}' not found. Valid presets: {VALID_LAMPS}"
-        )
+    preset_id_lower = _validated_preset(preset_id)
 
     try:
-        lamp = Lamp.from_keyword(preset_id_lower)
+        csv_bytes = _preset_spectrum_csv(preset_id_lower)
 
-        if lamp.spectrum is None:
+        if csv_bytes is None:
             raise HTTPException(
                 status_code=404,
                 detail=f"No spectrum data available for lamp '{preset_id}'"
             )
 
-        csv_bytes = lamp.spectrum.to_csv()
-
         return Response(
             content=csv_bytes,
             media_type="text/csv",
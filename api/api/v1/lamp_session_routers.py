@@ -4,6 +4,7 @@ Lamp Session Routers - Lamp CRUD, IES/spectrum upload, and plotting endpoints.
 
 import io
 import base64
+import hashlib
 import os
 import pathlib
 import tempfile
@@ -26,12 +27,9 @@ from guv_calcs.safety import PhotStandard
 from guv_calcs.lamp.lamp_placement import LampPlacer
 from guv_calcs.lamp.lamp_configs import resolve_keyword
 
-try:
-    from scipy.spatial import Delaunay
-except ImportError:
-    Delaunay = None
-
-from .utils import fig_to_base64, get_theme_colors, apply_theme
+from .utils import fig_to_base64, get_theme_colors, apply_theme, run_plot, NumpyJSONResponse, ORJSONRoute
+from .utils.triangulation import Delaunay, delaunay_simplices
+from .session_manager import Session
 from .session_helpers import (
     InitializedSessionDep,
     locked_session,
@@ -71,7 +69,7 @@ from .session_schemas import (
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+router = APIRouter(route_class=ORJSONRoute)
 
 
 # ============================================================
@@ -343,6 +341,7 @@ def delete_session_lamp(lamp_id: str, session: InitializedSessionDep):
         try:
             lamp = _get_lamp_or_404(session, lamp_id)
             session.room.lamps.remove(lamp.id)
+            session.lamp_plot_cache.pop(lamp_id, None)
 
             logger.debug(f"Deleted lamp {lamp_id}")
             return SuccessResponse(success=True, message="Lamp deleted", state_hashes=_get_state_hashes(session))
@@ -1034,8 +1033,32 @@ def get_session_lamp_info(
         _log_and_raise("Failed to get lamp info", e, 500)
 
 
+def _lamp_plot_fingerprint(lamp) -> tuple:
+    """Everything the info plots are drawn from, as a comparable tuple.
+
+    calc_state fingerprints the photometry (and scaling); update_state covers
+    intensity units. It also carries position/aim, which the plots ignore,
+    so moving a lamp re-renders once: harmless, just not minimal.
+    """
+    spectrum = lamp.spectrum
+    if spectrum is not None:
+        spectrum_fingerprint = hashlib.sha1(
+            np.ascontiguousarray(spectrum.wavelengths).tobytes()
+            + np.ascontiguousarray(spectrum.intensities).tobytes()
+        ).digest()
+    else:
+        spectrum_fingerprint = None
+    return (lamp.calc_state, lamp.update_state, spectrum_fingerprint)
+
+
+# Resolutions session lamp plots are rendered (and cached) at. Other DPIs are
+# rejected so a client can't grow a lamp's cached renders without limit by
+# varying the query value; 300 is the hi-res variant.
+_LAMP_PLOT_DPIS = (100, 150, 300)
+
+
 @router.get("/lamps/{lamp_id}/info/plots", response_model=LampPlotsResponse)
-def get_session_lamp_plots(
+async def get_session_lamp_plots(
     lamp_id: str,
     session: InitializedSessionDep,
     spectrum_scale: str = "linear",
@@ -1048,7 +1071,32 @@ def get_session_lamp_plots(
     Separated from /lamps/{lamp_id}/info for progressive loading — the main
     info endpoint returns TLVs + power instantly while this endpoint
     generates the slower matplotlib renders.
+
+    Rendered images are cached on the session per lamp and reused until the
+    lamp's photometry, spectrum or units change.
     """
+    # Normalize the cache key: any theme but 'light' already renders dark
+    theme = 'light' if theme == 'light' else 'dark'
+    if dpi not in _LAMP_PLOT_DPIS:
+        raise HTTPException(
+            status_code=422,
+            detail=f"dpi must be one of {', '.join(map(str, _LAMP_PLOT_DPIS))}",
+        )
+    return await run_plot(
+        _render_session_lamp_plots,
+        lamp_id, session, spectrum_scale, theme, dpi, include_hires,
+    )
+
+
+def _render_session_lamp_plots(
+    lamp_id: str,
+    session: Session,
+    spectrum_scale: str,
+    theme: str,
+    dpi: int,
+    include_hires: bool,
+):
+    """Render (or reuse cached) lamp info plots; runs on the plot pool."""
     lamp = _get_lamp_or_404(session, lamp_id)
 
     has_ies = lamp.ies is not None
@@ -1058,6 +1106,22 @@ def get_session_lamp_plots(
         return LampPlotsResponse(lamp_id=lamp_id)
 
     try:
+        fingerprint = _lamp_plot_fingerprint(lamp)
+        cached = session.lamp_plot_cache.get(lamp_id)
+        if cached is None or cached[0] != fingerprint:
+            cached = (fingerprint, {})
+            session.lamp_plot_cache[lamp_id] = cached
+        rendered = cached[1]
+
+        def _cached_render(key, render):
+            # Failed renders (None) are retried on the next request
+            image = rendered.get(key)
+            if image is None:
+                image = render()
+                if image is not None:
+                    rendered[key] = image
+            return image
+
         colors = get_theme_colors(theme)
         bg_color = colors['bg_color']
         is_dark = theme != 'light'
@@ -1093,9 +1157,11 @@ def get_session_lamp_plots(
                     if fig is not None:
                         plt.close(fig)
 
-            photometric_plot_base64 = _gen_photometric(dpi)
+            photometric_plot_base64 = _cached_render(
+                ("photometric", theme, dpi), lambda: _gen_photometric(dpi))
             if include_hires:
-                photometric_plot_hires_base64 = _gen_photometric(300)
+                photometric_plot_hires_base64 = _cached_render(
+                    ("photometric", theme, 300), lambda: _gen_photometric(300))
 
         # --- Spectrum plots ---
         spectrum_plot_base64 = None
@@ -1120,16 +1186,20 @@ def get_session_lamp_plots(
                     if fig is not None:
                         plt.close(fig)
 
-            spectrum_linear_plot_base64 = _gen_spectrum("linear", dpi)
-            spectrum_log_plot_base64 = _gen_spectrum("log", dpi)
+            spectrum_linear_plot_base64 = _cached_render(
+                ("spectrum", "linear", theme, dpi), lambda: _gen_spectrum("linear", dpi))
+            spectrum_log_plot_base64 = _cached_render(
+                ("spectrum", "log", theme, dpi), lambda: _gen_spectrum("log", dpi))
             spectrum_plot_base64 = (
                 spectrum_linear_plot_base64 if spectrum_scale == "linear"
                 else spectrum_log_plot_base64
             )
 
             if include_hires:
-                spectrum_linear_plot_hires_base64 = _gen_spectrum("linear", 300)
-                spectrum_log_plot_hires_base64 = _gen_spectrum("log", 300)
+                spectrum_linear_plot_hires_base64 = _cached_render(
+                    ("spectrum", "linear", theme, 300), lambda: _gen_spectrum("linear", 300))
+                spectrum_log_plot_hires_base64 = _cached_render(
+                    ("spectrum", "log", theme, 300), lambda: _gen_spectrum("log", 300))
                 spectrum_plot_hires_base64 = (
                     spectrum_linear_plot_hires_base64 if spectrum_scale == "linear"
                     else spectrum_log_plot_hires_base64
@@ -1219,7 +1289,7 @@ def get_session_lamp_advanced_settings(lamp_id: str, session: InitializedSession
 
 
 @router.get("/lamps/{lamp_id}/surface-plot", response_model=SurfacePlotResponse)
-def get_session_lamp_surface_plot(
+async def get_session_lamp_surface_plot(
     lamp_id: str,
     session: InitializedSessionDep,
     theme: str = "dark",
@@ -1230,6 +1300,11 @@ def get_session_lamp_surface_plot(
     Shows grid points and intensity distribution for near-field calculations.
     Requires X-Session-ID header.
     """
+    return await run_plot(_render_session_lamp_surface_plot, lamp_id, session, theme, dpi)
+
+
+def _render_session_lamp_surface_plot(lamp_id: str, session: Session, theme: str, dpi: int):
+    """Render the surface plot; runs on the plot pool."""
     lamp = _get_lamp_or_404(session, lamp_id)
 
     # Need source dimensions for a meaningful surface plot
@@ -1266,7 +1341,7 @@ def get_session_lamp_surface_plot(
 
 
 @router.get("/lamps/{lamp_id}/grid-points-plot", response_model=SimplePlotResponse)
-def get_session_lamp_grid_points_plot(
+async def get_session_lamp_grid_points_plot(
     lamp_id: str,
     session: InitializedSessionDep,
     theme: str = "dark",
@@ -1277,6 +1352,11 @@ def get_session_lamp_grid_points_plot(
     Shows the discretization grid for near-field calculations.
     Requires X-Session-ID header.
     """
+    return await run_plot(_render_session_lamp_grid_points_plot, lamp_id, session, theme, dpi)
+
+
+def _render_session_lamp_grid_points_plot(lamp_id: str, session: Session, theme: str, dpi: int):
+    """Render the grid points plot; runs on the plot pool."""
     lamp = _get_lamp_or_404(session, lamp_id)
 
     # Need source dimensions for a meaningful plot
@@ -1314,7 +1394,7 @@ def get_session_lamp_grid_points_plot(
 
 
 @router.get("/lamps/{lamp_id}/intensity-map-plot", response_model=SimplePlotResponse)
-def get_session_lamp_intensity_map_plot(
+async def get_session_lamp_intensity_map_plot(
     lamp_id: str,
     session: InitializedSessionDep,
     theme: str = "dark",
@@ -1325,6 +1405,11 @@ def get_session_lamp_intensity_map_plot(
     Shows the relative intensity distribution across the lamp surface.
     Requires X-Session-ID header.
     """
+    return await run_plot(_render_session_lamp_intensity_map_plot, lamp_id, session, theme, dpi)
+
+
+def _render_session_lamp_intensity_map_plot(lamp_id: str, session: Session, theme: str, dpi: int):
+    """Render the intensity map plot; runs on the plot pool."""
     lamp = _get_lamp_or_404(session, lamp_id)
 
     # Need an intensity map loaded
@@ -1397,18 +1482,18 @@ def get_session_lamp_photometric_web(lamp_id: str, session: InitializedSessionDe
         # Convert web vertices to session units so they match the room scale
         unit_factor = 1.0 / 0.3048 if str(session.room.units) == "feet" else 1.0
         coords = lamp.photometric_coords / init_scale * power_scale * unit_factor  # (N, 3)
-        x, y, z = coords.T  # (3, N)
 
         # Perform Delaunay triangulation in polar space (using original coords)
-        Theta, Phi, R = to_polar(*lamp.photometric_coords.T)
-        tri = Delaunay(np.column_stack((Theta.flatten(), Phi.flatten())))
+        # to_polar returns one (3, N) array; its theta/phi rows transposed are
+        # the (N, 2) Delaunay input, made contiguous with a single copy. The
+        # angles don't depend on placement, so a lamp loaded from a preset
+        # reuses the preset's triangulation.
+        theta_phi = np.ascontiguousarray(to_polar(*lamp.photometric_coords.T)[:2].T)
+        triangles = delaunay_simplices(theta_phi)
 
-        # Build vertex list (centered at origin)
-        vertices = [[float(x[i]), float(y[i]), float(z[i])] for i in range(len(x))]
-
-        # Build triangle list from Delaunay simplices
-        triangles = [[int(tri.simplices[i, 0]), int(tri.simplices[i, 1]), int(tri.simplices[i, 2])]
-                     for i in range(len(tri.simplices))]
+        # Vertices (centered at origin) and Delaunay triangles stay as arrays;
+        # orjson encodes them straight from their C-contiguous buffers
+        vertices = np.ascontiguousarray(coords)
 
         # Aim line: from origin to 1 unit down (will be transformed client-side)
         aim_line = [[0.0, 0.0, 0.0], [0.0, 0.0, -1.0 * unit_factor]]
@@ -1427,7 +1512,7 @@ def get_session_lamp_photometric_web(lamp_id: str, session: InitializedSessionDe
                 if local_points.ndim == 1:
                     surface_points = [local_points.tolist()]
                 else:
-                    surface_points = [[float(p[0]), float(p[1]), float(p[2])] for p in local_points]
+                    surface_points = local_points[:, :3].tolist()
             else:
                 surface_points = [[0.0, 0.0, 0.0]]
         except Exception as e:
@@ -1441,7 +1526,7 @@ def get_session_lamp_photometric_web(lamp_id: str, session: InitializedSessionDe
                 corners = lamp.geometry.get_bounding_box_corners()
                 # World → local: subtract position, then rotate back
                 local_corners = (rot @ (corners - lamp.position).T).T
-                fixture_bounds = [[float(c[0]), float(c[1]), float(c[2])] for c in local_corners]
+                fixture_bounds = local_corners[:, :3].tolist()
         except Exception as e:
             logger.warning(f"Failed to get fixture bounds for session lamp {lamp_id}: {e}")
             fixture_bounds = None
@@ -1459,14 +1544,17 @@ def get_session_lamp_photometric_web(lamp_id: str, session: InitializedSessionDe
         else:
             color = "#cc61ff"   # default
 
-        return SessionPhotometricWebResponse(
-            vertices=vertices,
-            triangles=triangles,
-            aim_line=aim_line,
-            surface_points=surface_points,
-            fixture_bounds=fixture_bounds,
-            color=color,
-        )
+        # Encoded directly rather than through the model, so thousands of
+        # vertices aren't validated one float at a time; response_model
+        # still documents the schema.
+        return NumpyJSONResponse({
+            "vertices": vertices,
+            "triangles": triangles,
+            "aim_line": aim_line,
+            "surface_points": surface_points,
+            "fixture_bounds": fixture_bounds,
+            "color": color,
+        })
 
     except Exception as e:
         logger.error(f"Failed to compute photometric web for session lamp {lamp_id}: {e}")
@@ -8,10 +8,12 @@ error formatting, and suggestions.
 """
 import logging
 from math import prod
-from typing import TYPE_CHECKING, List, Dict
+from typing import TYPE_CHECKING, List, Dict, Optional
 
 from fastapi import HTTPException
 
+from .utils import zone_grid
+
 if TYPE_CHECKING:
     from .session_manager import Session
 
@@ -41,21 +43,17 @@ MIN_SPACING = 0.005
 # =============================================================================
 
 
-def estimate_session_cost(session: "Session") -> dict:
-    """
-    Estimate memory and time cost for a session.
+def zone_grid_points(zone) -> int:
+    """Number of grid points in a calc zone (or a reflectance surface's plane)."""
+    return prod(zone_grid(zone).counts)
 
-    Delegates to guv_calcs for raw estimates, then adds API-layer context
-    (per-zone breakdown, reflectance pass info, time padding).
 
-    Returns:
-        Dictionary with memory breakdown (MB), time estimate, and per-zone details
-    """
-    # Per-zone breakdown for the frontend
+def _zone_details(session: "Session") -> List[Dict]:
+    """Per-zone grid size and memory breakdown, largest first."""
     zone_details: List[Dict] = []
     for zone_id, zone in session.room.calc_zones.items():
         enabled = getattr(zone, 'enabled', True)
-        points = prod(zone.num_points)
+        points = zone_grid_points(zone)
         zone_details.append({
             'id': zone_id,
             'name': getattr(zone, 'name', None) or zone_id,
@@ -65,7 +63,11 @@ def estimate_session_cost(session: "Session") -> dict:
             'memory_mb': round(points * 90 / 1_000_000, 1) if enabled else 0,
         })
     zone_details.sort(key=lambda z: z['memory_mb'], reverse=True)
+    return zone_details
+
 
+def estimate_session_totals(session: "Session") -> dict:
+    """Session-wide memory and time estimate, without the per-zone breakdown."""
     # Delegate to guv_calcs for authoritative memory estimate
     mem = session.room.estimate_memory()
 
@@ -86,7 +88,6 @@ def estimate_session_cost(session: "Session") -> dict:
 
     return {
         'total_grid_points': mem['total_zone_points'],
-        'zones': zone_details,
         'lamp_count': mem['lamp_count'],
         'reflectance_enabled': reflectance_enabled,
         'reflectance_passes': reflectance_passes,
@@ -99,6 +100,19 @@ def estimate_session_cost(session: "Session") -> dict:
     }
 
 
+def estimate_session_cost(session: "Session") -> dict:
+    """
+    Estimate memory and time cost for a session.
+
+    Delegates to guv_calcs for raw estimates, then adds API-layer context
+    (per-zone breakdown, reflectance pass info, time padding).
+
+    Returns:
+        Dictionary with memory breakdown (MB), time estimate, and per-zone details
+    """
+    return {'zones': _zone_details(session), **estimate_session_totals(session)}
+
+
 def get_budget_reduction_suggestions(estimate: dict, time_exceeded: bool = False, memory_exceeded: bool = False) -> list:
     """
     Generate actionable suggestions based on what's using the most resources.
@@ -148,15 +162,19 @@ def get_budget_reduction_suggestions(estimate: dict, time_exceeded: bool = False
     return suggestions
 
 
-def check_budget(session: "Session", additional_memory_mb: float = 0) -> None:
+def check_budget(session: "Session", additional_memory_mb: float = 0) -> dict:
     """
     Check if session exceeds memory or time limits and raise HTTPException if so.
 
     Enforces two limits:
     1. Peak memory estimate (MAX_PEAK_MEMORY_MB)
     2. Estimated calculation time (MAX_CALC_TIME_SECONDS)
+
+    Returns the session's cost estimate when within budget, so callers can
+    reuse it instead of estimating again. The per-zone breakdown is only
+    built for the error payload, so the returned estimate has no 'zones'.
     """
-    estimate = estimate_session_cost(session)
+    estimate = estimate_session_totals(session)
     peak_mb = estimate['peak_memory_mb'] + additional_memory_mb
     calc_time = estimate['calc_time_seconds']
 
@@ -164,7 +182,9 @@ def check_budget(session: "Session", additional_memory_mb: float = 0) -> None:
     time_exceeded = calc_time > MAX_CALC_TIME_SECONDS
 
     if not memory_exceeded and not time_exceeded:
-        return
+        return estimate
+
+    estimate['zones'] = _zone_details(session)
 
     detail = {
         "error": "budget_exceeded",
@@ -222,9 +242,14 @@ def check_budget(session: "Session", additional_memory_mb: float = 0) -> None:
     raise HTTPException(status_code=400, detail=detail)
 
 
-def log_calculation_start(session: "Session") -> dict:
-    """Log calculation start with cost estimate. Returns estimate for later comparison."""
-    estimate = estimate_session_cost(session)
+def log_calculation_start(session: "Session", estimate: Optional[dict] = None) -> dict:
+    """Log calculation start with cost estimate. Returns estimate for later comparison.
+
+    Pass ``estimate`` when one was just computed (e.g. by check_budget) to
+    skip re-estimating the session.
+    """
+    if estimate is None:
+        estimate = estimate_session_totals(session)
 
     refl_info = ""
     if estimate['reflectance_enabled']:
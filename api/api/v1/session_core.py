@@ -5,9 +5,7 @@ Handles session creation, initialization, unit conversion, room updates,
 state hashes, and status queries.
 """
 
-import uuid as uuid_module
 import logging
-from math import prod
 
 from fastapi import APIRouter, HTTPException
 
@@ -16,6 +14,7 @@ from guv_calcs.project import Project
 from guv_calcs.calc_zone import CalcPlane, CalcVol, CalcPoint
 
 from .session_manager import Session, get_session_manager
+from .utils import ORJSONRoute
 from .session_helpers import (
     SessionDep,
     InitializedSessionDep,
@@ -45,11 +44,12 @@ from guv_calcs.performance import BYTES_PER_FORM_FACTOR_ENTRY, REFLECTANCE_OVERH
 from .resource_limits import (
     estimate_session_cost,
     check_budget,
+    zone_grid_points,
 )
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+router = APIRouter(route_class=ORJSONRoute)
 
 
 # ============================================================
@@ -69,7 +69,7 @@ def create_new_session():
         session_id: The unique session identifier (for X-Session-ID header)
         token: The authentication token (for Authorization: Bearer header)
     """
-    session_id = str(uuid_module.uuid4())
+    session_id = Session.generate_id()
     token = Session.generate_token()
     token_hash = Session.hash_token(token)
 
@@ -164,7 +164,9 @@ def init_session(request: SessionInitRequest, session: SessionCreateDep):
             # Add zones
             _STANDARD_IDS = {EYE_LIMITS, SKIN_LIMITS, WHOLE_ROOM_FLUENCE}
             for zone_input in request.zones:
-                zone = _create_zone_from_input(zone_input, session.room)
+                # The room is fresh, so a standard zone already present was
+                # added by an earlier input in this loop and can be reused.
+                zone = _create_zone_from_input(zone_input, session.room, reuse_standard=True)
                 # Standard zones are already added to the room by
                 # room.add_standard_zones() inside _create_zone_from_input.
                 # Non-standard zones must always go through add_calc_zone so the
@@ -328,7 +330,7 @@ def update_session_room(updates: SessionRoomUpdate, session: InitializedSessionD
                 # Estimate memory cost of enabling reflectance:
                 # form factors scale as refl_points² × 8 bytes
                 refl_points = sum(
-                    prod(s.plane.num_points) for s in session.room.surfaces.values()
+                    zone_grid_points(s.plane) for s in session.room.surfaces.values()
                 )
                 # Estimate additional memory: overhead + form factor cache
                 # (simplified: assumes zone_points ≈ refl_points for pre-flight check)
@@ -24,6 +24,7 @@ import numpy as np
 
 from .session_manager import Session, get_session_manager
 from .session_schemas import LoadedLamp, LoadedZone
+from .utils import zone_grid
 
 logger = logging.getLogger(__name__)
 
@@ -349,11 +350,141 @@ def _create_lamp_from_input(lamp_input, units=None) -> Lamp:
     return lamp
 
 
-def _create_zone_from_input(zone_input, room: Room):
-    """Create a guv_calcs CalcPlane or CalcVol from session input."""
+# SessionZoneInput fields passed through unchanged to every zone constructor.
+_COMMON_ZONE_FIELDS = frozenset({"name", "dose", "hours", "minutes", "seconds"})
+
+
+def _common_zone_kwargs(zone_input) -> dict:
+    """Constructor kwargs shared by all zone types, in one model_dump."""
+    kwargs = zone_input.model_dump(include=_COMMON_ZONE_FIELDS)
+    kwargs["zone_id"] = zone_input.id
+    return kwargs
+
+
+def _build_plane_zone(zone_input, room: Room):
+    """Build a CalcPlane from session zone input."""
+    x1_val = zone_input.x1 if zone_input.x1 is not None else 0
+    x2_val = zone_input.x2 if zone_input.x2 is not None else room.x
+    x1_val, x2_val = min(x1_val, x2_val), max(x1_val, x2_val)
+    y1_val = zone_input.y1 if zone_input.y1 is not None else 0
+    y2_val = zone_input.y2 if zone_input.y2 is not None else room.y
+    y1_val, y2_val = min(y1_val, y2_val), max(y1_val, y2_val)
+
+    grid_kwargs = {}
+    if zone_input.num_x is not None and zone_input.num_y is not None:
+        grid_kwargs["num_points_init"] = (zone_input.num_x, zone_input.num_y)
+    elif zone_input.x_spacing is not None and zone_input.y_spacing is not None:
+        grid_kwargs["spacing_init"] = (zone_input.x_spacing, zone_input.y_spacing)
+    if zone_input.offset is not None:
+        grid_kwargs["offset"] = zone_input.offset
+
+    geometry = SurfaceGrid.from_legacy(
+        mins=(x1_val, y1_val),
+        maxs=(x2_val, y2_val),
+        height=zone_input.height if zone_input.height is not None else 1.0,
+        ref_surface=zone_input.ref_surface if zone_input.ref_surface is not None else "xy",
+        direction=zone_input.direction if zone_input.direction not in (None, 0) else 1,
+        **grid_kwargs,
+    )
+    # view_direction and view_target are mutually exclusive in guv_calcs.
+    # The frontend store may carry both (stale value from a previous mode),
+    # so only pass the one that matches the current calc_mode.
+    vd = zone_input.view_direction
+    vt = zone_input.view_target
+    if vd is not None and vt is not None:
+        # Resolve conflict: keep the one matching calc_mode, clear the other
+        if zone_input.calc_mode == "eye_target":
+            vd = None
+        else:
+            vt = None
+
+    return CalcPlane(
+        geometry=geometry,
+        calc_mode=zone_input.calc_mode,
+        horiz=zone_input.horiz,
+        vert=zone_input.vert,
+        fov_vert=zone_input.fov_vert,
+        fov_horiz=zone_input.fov_horiz,
+        use_normal=zone_input.use_normal if zone_input.use_normal is not None else (zone_input.direction != 0 if zone_input.direction is not None else None),
+        view_direction=vd,
+        view_target=vt,
+        **_common_zone_kwargs(zone_input),
+    )
+
+
+def _build_point_zone(zone_input, room: Room):
+    """Build a CalcPoint from session zone input."""
+    position = (
+        zone_input.x if zone_input.x is not None else room.x / 2,
+        zone_input.y if zone_input.y is not None else room.y / 2,
+        zone_input.z if zone_input.z is not None else 1.0,
+    )
+    aim_point = (
+        zone_input.aim_x if zone_input.aim_x is not None else position[0],
+        zone_input.aim_y if zone_input.aim_y is not None else position[1],
+        zone_input.aim_z if zone_input.aim_z is not None else position[2] + 1.0,
+    )
+    return CalcPoint.at(
+        position=position,
+        aim_point=aim_point,
+        horiz=zone_input.horiz if zone_input.horiz is not None else True,
+        vert=zone_input.vert if zone_input.vert is not None else False,
+        use_normal=True,
+        fov_vert=zone_input.fov_vert if zone_input.fov_vert is not None else 180,
+        fov_horiz=zone_input.fov_horiz if zone_input.fov_horiz is not None else 360,
+        **_common_zone_kwargs(zone_input),
+    )
+
+
+def _build_volume_zone(zone_input, room: Room):
+    """Build a CalcVol from session zone input."""
+    x1_val = zone_input.x_min if zone_input.x_min is not None else 0
+    x2_val = zone_input.x_max if zone_input.x_max is not None else room.x
+    x1_val, x2_val = min(x1_val, x2_val), max(x1_val, x2_val)
+    y1_val = zone_input.y_min if zone_input.y_min is not None else 0
+    y2_val = zone_input.y_max if zone_input.y_max is not None else room.y
+    y1_val, y2_val = min(y1_val, y2_val), max(y1_val, y2_val)
+    z1_val = zone_input.z_min if zone_input.z_min is not None else 0
+    z2_val = zone_input.z_max if zone_input.z_max is not None else room.z
+    z1_val, z2_val = min(z1_val, z2_val), max(z1_val, z2_val)
+
+    grid_kwargs = {}
+    if zone_input.num_x is not None and zone_input.num_y is not None and zone_input.num_z is not None:
+        grid_kwargs["num_points_init"] = (zone_input.num_x, zone_input.num_y, zone_input.num_z)
+    elif zone_input.x_spacing is not None and zone_input.y_spacing is not None and zone_input.z_spacing is not None:
+        grid_kwargs["spacing_init"] = (zone_input.x_spacing, zone_input.y_spacing, zone_input.z_spacing)
+    if zone_input.offset is not None:
+        grid_kwargs["offset"] = zone_input.offset
+
+    geometry = VolumeGrid.from_legacy(
+        mins=(x1_val, y1_val, z1_val),
+        maxs=(x2_val, y2_val, z2_val),
+        **grid_kwargs,
+    )
+    return CalcVol(geometry=geometry, **_common_zone_kwargs(zone_input))
+
+
+# Zone type -> builder; one dict lookup instead of an if/elif chain.
+_ZONE_BUILDERS = {
+    "plane": _build_plane_zone,
+    "point": _build_point_zone,
+    "volume": _build_volume_zone,
+}
+
+
+def _create_zone_from_input(zone_input, room: Room, reuse_standard: bool = False):
+    """Create a guv_calcs CalcPlane or CalcVol from session input.
+
+    Standard zone ids go through room.add_standard_zones(), which rebuilds
+    all three standard zones at once. With reuse_standard=True a standard
+    zone already in the room is taken as-is, so a batch of inputs builds the
+    standard set once instead of overwriting it (and its flags) per input.
+    """
     if zone_input.id in (EYE_LIMITS, SKIN_LIMITS, WHOLE_ROOM_FLUENCE):
-        room.add_standard_zones(on_collision="overwrite")
-        zone = room.calc_zones.get(zone_input.id)
+        zone = room.calc_zones.get(zone_input.id) if reuse_standard else None
+        if zone is None:
+            room.add_standard_zones(on_collision="overwrite")
+            zone = room.calc_zones.get(zone_input.id)
         if zone is not None:
             zone.enabled = zone_input.enabled
             if hasattr(zone_input, 'display_mode') and zone_input.display_mode is not None:
@@ -361,113 +492,10 @@ def _create_zone_from_input(zone_input, room: Room):
             return zone
         logger.warning(f"add_standard_zones() did not create {zone_input.id}, falling back to manual creation")
 
-    if zone_input.type == "plane":
-        x1_val = zone_input.x1 if zone_input.x1 is not None else 0
-        x2_val = zone_input.x2 if zone_input.x2 is not None else room.x
-        x1_val, x2_val = min(x1_val, x2_val), max(x1_val, x2_val)
-        y1_val = zone_input.y1 if zone_input.y1 is not None else 0
-        y2_val = zone_input.y2 if zone_input.y2 is not None else room.y
-        y1_val, y2_val = min(y1_val, y2_val), max(y1_val, y2_val)
-
-        grid_kwargs = {}
-        if zone_input.num_x is not None and zone_input.num_y is not None:
-            grid_kwargs["num_points_init"] = (zone_input.num_x, zone_input.num_y)
-        elif zone_input.x_spacing is not None and zone_input.y_spacing is not None:
-            grid_kwargs["spacing_init"] = (zone_input.x_spacing, zone_input.y_spacing)
-        if zone_input.offset is not None:
-            grid_kwargs["offset"] = zone_input.offset
-
-        geometry = SurfaceGrid.from_legacy(
-            mins=(x1_val, y1_val),
-            maxs=(x2_val, y2_val),
-            height=zone_input.height if zone_input.height is not None else 1.0,
-            ref_surface=zone_input.ref_surface if zone_input.ref_surface is not None else "xy",
-            direction=zone_input.direction if zone_input.direction not in (None, 0) else 1,
-            **grid_kwargs,
-        )
-        # view_direction and view_target are mutually exclusive in guv_calcs.
-        # The frontend store may carry both (stale value from a previous mode),
-        # so only pass the one that matches the current calc_mode.
-        vd = zone_input.view_direction
-        vt = zone_input.view_target
-        if vd is not None and vt is not None:
-            # Resolve conflict: keep the one matching calc_mode, clear the other
-            if zone_input.calc_mode == "eye_target":
-                vd = None
-            else:
-                vt = None
-
-        zone = CalcPlane(
-            zone_id=zone_input.id,
-            name=zone_input.name,
-            geometry=geometry,
-            calc_mode=zone_input.calc_mode,
-            horiz=zone_input.horiz,
-            vert=zone_input.vert,
-            fov_vert=zone_input.fov_vert,
-            fov_horiz=zone_input.fov_horiz,
-            use_normal=zone_input.use_normal if zone_input.use_normal is not None else (zone_input.direction != 0 if zone_input.direction is not None else None),
-            view_direction=vd,
-            view_target=vt,
-            dose=zone_input.dose,
-            hours=zone_input.hours, minutes=zone_input.minutes, seconds=zone_input.seconds,
-        )
-    elif zone_input.type == "point":
-        position = (
-            zone_input.x if zone_input.x is not None else room.x / 2,
-            zone_input.y if zone_input.y is not None else room.y / 2,
-            zone_input.z if zone_input.z is not None else 1.0,
-        )
-        aim_point = (
-            zone_input.aim_x if zone_input.aim_x is not None else position[0],
-            zone_input.aim_y if zone_input.aim_y is not None else position[1],
-            zone_input.aim_z if zone_input.aim_z is not None else position[2] + 1.0,
-        )
-        zone = CalcPoint.at(
-            position=position,
-            aim_point=aim_point,
-            zone_id=zone_input.id,
-            name=zone_input.name,
-            horiz=zone_input.horiz if zone_input.horiz is not None else True,
-            vert=zone_input.vert if zone_input.vert is not None else False,
-            use_normal=True,
-            fov_vert=zone_input.fov_vert if zone_input.fov_vert is not None else 180,
-            fov_horiz=zone_input.fov_horiz if zone_input.fov_horiz is not None else 360,
-            dose=zone_input.dose,
-            hours=zone_input.hours, minutes=zone_input.minutes, seconds=zone_input.seconds,
-        )
-    elif zone_input.type == "volume":
-        x1_val = zone_input.x_min if zone_input.x_min is not None else 0
-        x2_val = zone_input.x_max if zone_input.x_max is not None else room.x
-        x1_val, x2_val = min(x1_val, x2_val), max(x1_val, x2_val)
-        y1_val = zone_input.y_min if zone_input.y_min is not None else 0
-        y2_val = zone_input.y_max if zone_input.y_max is not None else room.y
-        y1_val, y2_val = min(y1_val, y2_val), max(y1_val, y2_val)
-        z1_val = zone_input.z_min if zone_input.z_min is not None else 0
-        z2_val = zone_input.z_max if zone_input.z_max is not None else room.z
-        z1_val, z2_val = min(z1_val, z2_val), max(z1_val, z2_val)
-
-        grid_kwargs = {}
-        if zone_input.num_x is not None and zone_input.num_y is not None and zone_input.num_z is not None:
-            grid_kwargs["num_points_init"] = (zone_input.num_x, zone_input.num_y, zone_input.num_z)
-        elif zone_input.x_spacing is not None and zone_input.y_spacing is not None and zone_input.z_spacing is not None:
-            grid_kwargs["spacing_init"] = (zone_input.x_spacing, zone_input.y_spacing, zone_input.z_spacing)
-        if zone_input.offset is not None:
-            grid_kwargs["offset"] = zone_input.offset
-
-        geometry = VolumeGrid.from_legacy(
-            mins=(x1_val, y1_val, z1_val),
-            maxs=(x2_val, y2_val, z2_val),
-            **grid_kwargs,
-        )
-        zone = CalcVol(
-            zone_id=zone_input.id, name=zone_input.name,
-            geometry=geometry,
-            dose=zone_input.dose,
-            hours=zone_input.hours, minutes=zone_input.minutes, seconds=zone_input.seconds,
-        )
-    else:
+    builder = _ZONE_BUILDERS.get(zone_input.type)
+    if builder is None:
         raise HTTPException(status_code=400, detail=f"Unknown zone type: {zone_input.type}")
+    zone = builder(zone_input, room)
 
     zone.enabled = zone_input.enabled
     if hasattr(zone_input, 'display_mode') and zone_input.display_mode is not None:
@@ -507,70 +535,85 @@ def _lamp_to_loaded(lamp, lamp_id: str):
 
 
 def _zone_to_loaded(zone, zone_id: str):
-    """Convert a guv_calcs CalcPlane/CalcVol to LoadedZone response"""
+    """Convert a guv_calcs CalcPlane/CalcVol to LoadedZone response
+
+    Grid fields come from ``zone_grid``, which reads counts, spacing and
+    extents once off the geometry instead of through CalcZone's passthrough.
+    """
 
     zone_type = zone.calctype.lower()
+    geom = zone.geometry
+    counts, spacing, mins, maxs = zone_grid(zone)
+    grid = dict(
+        num_x=counts[0] if len(counts) > 0 else None,
+        num_y=counts[1] if len(counts) > 1 else None,
+        x_spacing=spacing[0] if len(spacing) > 0 else None,
+        y_spacing=spacing[1] if len(spacing) > 1 else None,
+        offset=getattr(geom, 'offset', None),
+    )
 
     h, m, s = _decompose_time(zone)
-    loaded = LoadedZone(
+    fields = dict(
         id=zone_id,
         name=getattr(zone, 'name', None),
         type=zone_type,
         enabled=getattr(zone, 'enabled', True),
         is_standard=zone_id in (EYE_LIMITS, SKIN_LIMITS, WHOLE_ROOM_FLUENCE),
-        num_x=getattr(zone, 'num_x', None),
-        num_y=getattr(zone, 'num_y', None),
-        x_spacing=getattr(zone, 'x_spacing', None),
-        y_spacing=getattr(zone, 'y_spacing', None),
-        offset=getattr(zone, 'offset', None),
+        **grid,
         dose=getattr(zone, 'dose', None),
         hours=h, minutes=m, seconds=s,
         display_mode=getattr(zone, 'display_mode', 'heatmap'),
     )
 
     if zone_type == "plane":
-        loaded.calc_mode = zone.calc_mode
-        loaded.height = getattr(zone, 'height', None)
-        loaded.x1 = getattr(zone, 'x1', None)
-        loaded.x2 = getattr(zone, 'x2', None)
-        loaded.y1 = getattr(zone, 'y1', None)
-        loaded.y2 = getattr(zone, 'y2', None)
-        loaded.ref_surface = getattr(zone, 'ref_surface', None)
-        loaded.direction = getattr(zone, 'direction', None)
-        loaded.horiz = getattr(zone, 'horiz', None)
-        loaded.vert = getattr(zone, 'vert', None)
-        loaded.use_normal = getattr(zone, 'use_normal', None)
-        loaded.fov_vert = getattr(zone, 'fov_vert', None)
-        loaded.fov_horiz = getattr(zone, 'fov_horiz', None)
-        loaded.view_direction = getattr(zone, 'view_direction', None)
-        loaded.view_target = getattr(zone, 'view_target', None)
-        v_hat = getattr(zone.geometry, 'v_hat', None)
+        fields.update(
+            calc_mode=zone.calc_mode,
+            height=getattr(geom, 'height', None),
+            x1=mins[0] if len(mins) > 0 else None,
+            x2=maxs[0] if len(maxs) > 0 else None,
+            y1=mins[1] if len(mins) > 1 else None,
+            y2=maxs[1] if len(maxs) > 1 else None,
+            ref_surface=getattr(geom, 'ref_surface', None),
+            direction=getattr(geom, 'direction', None),
+            horiz=getattr(zone, 'horiz', None),
+            vert=getattr(zone, 'vert', None),
+            use_normal=getattr(zone, 'use_normal', None),
+            fov_vert=getattr(zone, 'fov_vert', None),
+            fov_horiz=getattr(zone, 'fov_horiz', None),
+            view_direction=getattr(zone, 'view_direction', None),
+            view_target=getattr(zone, 'view_target', None),
+        )
+        v_hat = getattr(geom, 'v_hat', None)
         if v_hat is not None:
             abs_v = np.abs(v_hat)
             v_idx = int(np.argmax(abs_v))
-            loaded.v_positive_direction = bool(v_hat[v_idx] > 0)
+            fields['v_positive_direction'] = bool(v_hat[v_idx] > 0)
     elif zone_type == "point":
-        loaded.x = zone.position[0]
-        loaded.y = zone.position[1]
-        loaded.z = zone.position[2]
-        loaded.aim_x = zone.aim_point[0]
-        loaded.aim_y = zone.aim_point[1]
-        loaded.aim_z = zone.aim_point[2]
-        loaded.horiz = getattr(zone, 'horiz', None)
-        loaded.vert = getattr(zone, 'vert', None)
-        loaded.fov_vert = getattr(zone, 'fov_vert', None)
-        loaded.fov_horiz = getattr(zone, 'fov_horiz', None)
-        loaded.calc_mode = getattr(zone, 'calc_mode', None)
+        fields.update(
+            x=zone.position[0],
+            y=zone.position[1],
+            z=zone.position[2],
+            aim_x=zone.aim_point[0],
+            aim_y=zone.aim_point[1],
+            aim_z=zone.aim_point[2],
+            horiz=getattr(zone, 'horiz', None),
+            vert=getattr(zone, 'vert', None),
+            fov_vert=getattr(zone, 'fov_vert', None),
+            fov_horiz=getattr(zone, 'fov_horiz', None),
+            calc_mode=getattr(zone, 'calc_mode', None),
+        )
     else:
-        loaded.num_z = getattr(zone, 'num_z', None)
-        loaded.z_spacing = getattr(zone, 'z_spacing', None)
-        loaded.x_min = getattr(zone, 'x1', None)
-        loaded.x_max = getattr(zone, 'x2', None)
-        loaded.y_min = getattr(zone, 'y1', None)
-        loaded.y_max = getattr(zone, 'y2', None)
-        loaded.z_min = getattr(zone, 'z1', None)
-        loaded.z_max = getattr(zone, 'z2', None)
-
-    return loaded
+        fields.update(
+            num_z=counts[2] if len(counts) > 2 else None,
+            z_spacing=spacing[2] if len(spacing) > 2 else None,
+            x_min=mins[0] if len(mins) > 0 else None,
+            x_max=maxs[0] if len(maxs) > 0 else None,
+            y_min=mins[1] if len(mins) > 1 else None,
+            y_max=maxs[1] if len(maxs) > 1 else None,
+            z_min=mins[2] if len(mins) > 2 else None,
+            z_max=maxs[2] if len(maxs) > 2 else None,
+        )
+
+    return LoadedZone(**fields)
 
 
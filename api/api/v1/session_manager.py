@@ -1,7 +1,7 @@
 """
 Session Manager - Handles multi-user session storage.
 
-Each session is identified by a unique session ID (UUID). Sessions are stored
+Each session is identified by a unique random session ID. Sessions are stored
 in memory with optional timeout-based cleanup. This enables multiple users/tabs
 to work independently without interference.
 
@@ -14,7 +14,6 @@ import secrets
 import threading
 import time
 from typing import Optional, Dict
-from uuid import uuid4
 import logging
 
 from guv_calcs.room import Room
@@ -49,6 +48,10 @@ class Session:
         self.created_at = time.time()
         self.last_accessed = time.time()
         self.lock = threading.Lock()  # serializes mutating requests on this session
+        # zone_id -> (fingerprint, SessionZoneState), rebuilt by GET /zones
+        self.zone_state_cache: Dict[str, tuple] = {}
+        # lamp_id -> (fingerprint, {plot key: base64 PNG}), filled by GET /lamps/{id}/info/plots
+        self.lamp_plot_cache: Dict[str, tuple] = {}
 
     @property
     def room(self) -> Optional[Room]:
@@ -82,6 +85,11 @@ class Session:
         """Generate a cryptographically secure session token."""
         return secrets.token_urlsafe(32)
 
+    @staticmethod
+    def generate_id() -> str:
+        """Generate a session ID (128 random bits as hex, no UUID formatting)."""
+        return secrets.token_hex(16)
+
 
 class SessionManager:
     """
@@ -168,7 +176,7 @@ class SessionManager:
                 )
 
             if session_id is None:
-                session_id = str(uuid4())
+                session_id = Session.generate_id()
 
             session = Session(id=session_id, token_hash=token_hash)
             self._sessions[session_id] = session
@@ -1,6 +1,6 @@
 """Pydantic schemas for the session router endpoints."""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, Dict, Literal, Any, List
 
 from .schemas import SurfaceReflectances, SimulationZoneResult
@@ -252,6 +252,10 @@ class SessionZoneUpdateResponse(BaseModel):
 
 class SessionZoneState(BaseModel):
     """Current state of a zone from the session"""
+    # Instances are cached per session and reused across GET /zones calls,
+    # so they must not be mutated after construction.
+    model_config = ConfigDict(frozen=True)
+
     id: str
     name: Optional[str] = None
     type: Literal["plane", "volume", "point"]
@@ -10,8 +10,15 @@ from fastapi.responses import JSONResponse
 from guv_calcs import Spectrum, PhotStandard, get_tlvs
 from guv_calcs.io import load_spectrum_file
 
+from .utils import ORJSONRoute
+
+try:
+    from guv_calcs import __version__ as GUV_CALCS_VERSION
+except ImportError:
+    GUV_CALCS_VERSION = "unknown"
+
 # === Utility Router Initialization ===
-utility_router = APIRouter()
+utility_router = APIRouter(route_class=ORJSONRoute)
 
 # Maximum spectrum file size (500 KB to accommodate Excel files with metadata headers)
 _MAX_SPECTRUM_FILE_SIZE = 500 * 1024
@@ -39,14 +46,10 @@ async def get_health(request:Request):
         "Use this to detect deprecations or unsupported versions."
     ),)
 async def get_version(request:Request):
-    try:
-        from guv_calcs import __version__ as guv_calcs_version
-    except ImportError:
-        guv_calcs_version = "unknown"
     return {
         "app": request.app.title,
         "version": request.app.version,
-        "guv_calcs_version": guv_calcs_version
+        "guv_calcs_version": GUV_CALCS_VERSION
     }
 
 
@@ -1,5 +1,13 @@
 """Utility functions for the API."""
 
-from .plotting import fig_to_base64, get_theme_colors, apply_theme
+from .plotting import (fig_to_base64, fig_to_image, get_theme_colors, apply_theme, ImageFormat, IMAGE_CONTENT_TYPES,
+                       run_plot, PLOT_LOCK)
+from .serialization import NumpyJSONResponse, NumpyJSONStreamingResponse, ORJSONRoute, iter_ndjson
+from .triangulation import delaunay_simplices
+from .zones import ZoneGrid, zone_grid
 
-__all__ = ["fig_to_base64", "get_theme_colors", "apply_theme"]
+__all__ = ["fig_to_base64", "fig_to_image", "get_theme_colors", "apply_theme", "ImageFormat",
+           "IMAGE_CONTENT_TYPES", "run_plot", "PLOT_LOCK",
+           "NumpyJSONResponse",
+           "NumpyJSONStreamingResponse", "ORJSONRoute", "iter_ndjson",
+           "delaunay_simplices", "ZoneGrid", "zone_grid"]
@@ -1,7 +1,12 @@
 """Plotting utilities for converting matplotlib figures to various formats."""
 
 import io
+import asyncio
 import base64
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Literal
 
 import matplotlib
 matplotlib.use('Agg')  # Non-interactive backend for server use
@@ -24,6 +29,44 @@ THEME_COLORS = {
 }
 
 
+# Formats the image endpoints can return, and their MIME types.  SVG skips
+# rasterization entirely; WebP encodes faster and smaller than PNG.
+ImageFormat = Literal["png", "svg", "webp"]
+IMAGE_CONTENT_TYPES = {
+    "png": "image/png",
+    "svg": "image/svg+xml",
+    "webp": "image/webp",
+}
+
+
+# pyplot keeps process-global state (the figure registry, rcParams swapped
+# by plt.style.context), so renders from different threads can break each
+# other. Anything that draws through pyplot holds this lock.
+PLOT_LOCK = threading.RLock()
+
+# Matplotlib renders run on their own pool instead of the shared threadpool
+# FastAPI uses for sync handlers, so a burst of plot requests can't take
+# every worker away from lightweight endpoints. Every render holds
+# PLOT_LOCK, so one worker is all the pool can use; the rest wait in its queue.
+MAX_CONCURRENT_PLOTS = 1
+_plot_executor = ThreadPoolExecutor(
+    max_workers=MAX_CONCURRENT_PLOTS, thread_name_prefix="plot"
+)
+
+
+def _locked_render(func, *args, **kwargs):
+    with PLOT_LOCK:
+        return func(*args, **kwargs)
+
+
+async def run_plot(func, *args, **kwargs):
+    """Run a blocking plot render on the dedicated plot pool and await it."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _plot_executor, functools.partial(_locked_render, func, *args, **kwargs)
+    )
+
+
 def get_theme_colors(theme: str) -> dict:
     """Return bg_color, text_color, grid_color for the given theme."""
     return THEME_COLORS.get(theme, THEME_COLORS['dark'])
@@ -83,6 +126,32 @@ def fig_to_base64(fig, dpi: int = 100, facecolor: str = 'white',
         save_kwargs['bbox_inches'] = bbox_inches
         save_kwargs['pad_inches'] = pad_inches
     fig.savefig(buf, **save_kwargs)
-    buf.seek(0)
     plt.close(fig)
-    return base64.b64encode(buf.read()).decode('utf-8')
+    return _buffer_to_base64(buf)
+
+
+def _buffer_to_base64(buf: io.BytesIO) -> str:
+    """Base64-encode a buffer's contents without copying them out first."""
+    return base64.b64encode(buf.getbuffer()).decode('ascii')
+
+
+def fig_to_image(fig, image_format: ImageFormat = "png", **savefig_kwargs) -> dict:
+    """Render a figure as ``{"image_base64", "content_type"}``.
+
+    Args:
+        fig: matplotlib Figure object (left open; the caller closes it)
+        image_format: 'png', 'svg' or 'webp'
+        **savefig_kwargs: Passed through to ``fig.savefig``
+
+    Returns:
+        Dict with the base64-encoded image and its MIME type
+    """
+    if image_format == "webp":
+        # Lossy q=80 with the fastest encoder method
+        savefig_kwargs.setdefault("pil_kwargs", {"quality": 80, "method": 0})
+    buf = io.BytesIO()
+    fig.savefig(buf, format=image_format, **savefig_kwargs)
+    return {
+        "image_base64": _buffer_to_base64(buf),
+        "content_type": IMAGE_CONTENT_TYPES[image_format],
+    }
@@ -0,0 +1,145 @@
+"""JSON serialization helpers for numeric-heavy responses."""
+
+from typing import Callable, Iterator
+
+import numpy as np
+import orjson
+from fastapi import Request, Response
+from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.routing import APIRoute
+
+
+# Approximate number of array elements encoded per streamed chunk, and the
+# byte size at which buffered output is flushed to the client.
+_STREAM_CHUNK_VALUES = 16384
+_STREAM_FLUSH_BYTES = 1 << 16
+
+# numpy arrays/scalars are written straight from their buffers, and int keys
+# (e.g. per-wavelength dicts) are stringified the same way stdlib json does.
+ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def dumps(content) -> bytes:
+    """Serialize content to JSON bytes, accepting numpy arrays directly."""
+    return orjson.dumps(content, option=ORJSON_OPTIONS)
+
+
+class NumpyJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson.
+
+    Meant for routes that return plain dicts/arrays. Routes with a
+    response_model (or return annotation) already serialize through
+    pydantic-core's dump_json fast path, which setting a custom
+    response_class would turn off.
+
+    Arrays in the payload must be C-contiguous (wrap with
+    ``np.ascontiguousarray`` if they come from a transpose or slice) so
+    orjson can walk the buffer without materializing Python floats.
+    """
+
+    def render(self, content) -> bytes:
+        return dumps(content)
+
+
+def _encode_key(key) -> bytes:
+    """Encode a dict key exactly as dumps() would, quotes included.
+
+    OPT_NON_STR_KEYS has its own spelling for non-str keys (None -> "null",
+    True -> "true", ...), so let orjson encode a one-entry dict and strip
+    the surrounding ``{`` and ``:null}``.
+    """
+    return dumps({key: None})[1:-6]
+
+
+def _iter_json(value) -> Iterator[bytes]:
+    """Yield JSON fragments for value, splitting large arrays by leading axis."""
+    if isinstance(value, dict):
+        yield b"{"
+        for i, (key, item) in enumerate(value.items()):
+            yield (b"," if i else b"") + _encode_key(key) + b":"
+            yield from _iter_json(item)
+        yield b"}"
+    elif isinstance(value, np.ndarray) and value.ndim >= 1 and value.size > _STREAM_CHUNK_VALUES:
+        row_size = max(1, value.size // len(value))
+        rows = max(1, _STREAM_CHUNK_VALUES // row_size)
+        yield b"["
+        for start in range(0, len(value), rows):
+            # Leading-axis slices of a C-contiguous array stay contiguous;
+            # strip each chunk's own brackets and join with commas.
+            body = dumps(value[start:start + rows])[1:-1]
+            yield (b"," if start else b"") + body
+        yield b"]"
+    else:
+        yield dumps(value)
+
+
+def iter_json(content, flush_bytes: int = _STREAM_FLUSH_BYTES) -> Iterator[bytes]:
+    """Encode content as JSON in bounded chunks.
+
+    Produces the same document as ``dumps(content)``, but large arrays are
+    encoded a slab at a time and output is flushed every ``flush_bytes``, so
+    the full body never has to exist in memory at once.
+    """
+    buf = bytearray()
+    for fragment in _iter_json(content):
+        buf += fragment
+        if len(buf) >= flush_bytes:
+            yield bytes(buf)
+            buf.clear()
+    if buf:
+        yield bytes(buf)
+
+
+def iter_ndjson(records, flush_bytes: int = _STREAM_FLUSH_BYTES) -> Iterator[bytes]:
+    """Encode an iterable of records as newline-delimited JSON, in chunks."""
+    buf = bytearray()
+    for record in records:
+        buf += dumps(record)
+        buf += b"\n"
+        if len(buf) >= flush_bytes:
+            yield bytes(buf)
+            buf.clear()
+    if buf:
+        yield bytes(buf)
+
+
+class NumpyJSONStreamingResponse(StreamingResponse):
+    """Streaming counterpart of NumpyJSONResponse for large array payloads.
+
+    Starlette iterates the sync generator in a worker thread, so encoding
+    stays off the event loop. Everything in ``content`` must be serializable
+    up front: once streaming starts the status code can no longer change.
+    """
+
+    def __init__(self, content, status_code: int = 200, headers=None):
+        super().__init__(
+            iter_json(content),
+            status_code=status_code,
+            headers=headers,
+            media_type="application/json",
+        )
+
+
+class _ORJSONRequest(Request):
+    async def json(self):
+        if not hasattr(self, "_json"):
+            self._json = orjson.loads(await self.body())
+        return self._json
+
+
+class ORJSONRoute(APIRoute):
+    """APIRoute that decodes JSON request bodies with orjson.
+
+    Set as ``route_class`` on each router. orjson.JSONDecodeError
+    subclasses json.JSONDecodeError, so malformed bodies still get
+    FastAPI's usual 422 json_invalid error. Unlike stdlib json, orjson
+    rejects the non-standard NaN/Infinity literals.
+    """
+
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+
+        async def orjson_route_handler(request: Request) -> Response:
+            return await handler(_ORJSONRequest(request.scope, request.receive))
+
+        return orjson_route_handler
@@ -0,0 +1,30 @@
+"""Delaunay triangulation of photometric angles for the photometric web."""
+
+from functools import lru_cache
+
+import numpy as np
+
+try:
+    from scipy.spatial import Delaunay
+except ImportError:
+    Delaunay = None
+
+
+def delaunay_simplices(theta_phi: np.ndarray) -> np.ndarray:
+    """Triangulate (theta, phi) points, reusing an earlier result for the same points.
+
+    Keyed by the points themselves, so every lamp sharing a photometry (a
+    preset and each session copy of it, wherever it is placed or aimed)
+    shares one read-only triangulation, while a change to the photometry
+    misses instead of reusing stale triangles.
+    """
+    theta_phi = np.ascontiguousarray(theta_phi, dtype=np.float64)
+    return _triangulate(theta_phi.shape, theta_phi.tobytes())
+
+
+@lru_cache(maxsize=32)
+def _triangulate(shape: tuple, points: bytes) -> np.ndarray:
+    """Delaunay simplices for packed float64 points."""
+    simplices = Delaunay(np.frombuffer(points).reshape(shape)).simplices
+    simplices.setflags(write=False)
+    return simplices
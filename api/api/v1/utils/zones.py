@@ -0,0 +1,33 @@
+"""Grid readouts for guv_calcs calc zones."""
+
+from typing import NamedTuple, Tuple
+
+import numpy as np
+
+
+class ZoneGrid(NamedTuple):
+    """Per-axis point counts, spacing and extent of a zone's grid."""
+    counts: Tuple[int, ...] = ()
+    spacing: Tuple[float, ...] = ()
+    mins: Tuple[float, ...] = ()
+    maxs: Tuple[float, ...] = ()
+
+
+def zone_grid(zone) -> ZoneGrid:
+    """Read a zone's grid once, straight off its geometry.
+
+    ``getattr(zone, 'num_x')`` and friends go through CalcZone.__getattr__'s
+    passthrough, which evaluates each property twice, and each of them
+    rebuilds the axis points or the extent. Point zones and zones without a
+    geometry have no grid and get empty tuples.
+    """
+    geom = zone.geometry
+    axes = getattr(geom, 'axes', None)
+    if axes is None:
+        return ZoneGrid()
+    return ZoneGrid(
+        counts=tuple(len(axis.points) for axis in axes),
+        spacing=tuple(geom.spacing),
+        mins=tuple(np.asarray(geom.mins, dtype=float).tolist()),
+        maxs=tuple(np.asarray(geom.maxs, dtype=float).tolist()),
+    )
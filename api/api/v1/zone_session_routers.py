@@ -2,23 +2,23 @@
 Zone Session Routers - Zone CRUD, zone plots, and zone export endpoints.
 """
 
-import io
-import base64
 import logging
 import matplotlib
 matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 import numpy as np
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
 from fastapi.responses import Response
 
 from guv_calcs import WHOLE_ROOM_FLUENCE, EYE_LIMITS, SKIN_LIMITS
 from guv_calcs.calc_zone import CalcPlane, CalcVol, CalcPoint
 from guv_calcs.plane_calc_mode import PlaneCalcMode
 
-from .utils import get_theme_colors, apply_theme
+from .utils import (get_theme_colors, apply_theme, fig_to_image, ImageFormat, NumpyJSONResponse, run_plot, ORJSONRoute,
+                    zone_grid)
 
+from .session_manager import Session
 from .session_helpers import (
     InitializedSessionDep,
     locked_session,
@@ -40,7 +40,7 @@ from .session_schemas import (
 )
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+router = APIRouter(route_class=ORJSONRoute)
 
 
 @router.post("/zones", response_model=AddZoneResponse)
@@ -87,6 +87,12 @@ def add_session_zone(zone: SessionZoneInput, session: InitializedSessionDep):
             _log_and_raise("Failed to add zone", e)
 
 
+# SessionZoneUpdate fields copied onto the zone as plain attributes.
+# Flags only apply to zones that have them, and go after calc_mode.
+_ZONE_ATTR_FIELDS = frozenset({"name", "enabled", "dose", "display_mode"})
+_ZONE_FLAG_FIELDS = frozenset({"fov_vert", "fov_horiz", "horiz", "vert", "use_normal"})
+
+
 @router.patch("/zones/{zone_id}", response_model=SessionZoneUpdateResponse)
 def update_session_zone(zone_id: str, updates: SessionZoneUpdate, session: InitializedSessionDep):
     """Update an existing zone's properties.
@@ -99,14 +105,16 @@ def update_session_zone(zone_id: str, updates: SessionZoneUpdate, session: Initi
     with locked_session(session):
         try:
             zone = _get_zone_or_404(session, zone_id)
+            # Zone kind drives most branches below; check it once.
+            is_plane = isinstance(zone, CalcPlane)
+            is_point = isinstance(zone, CalcPoint)
+            is_vol = isinstance(zone, CalcVol)
 
             # Basic property updates
-            if updates.name is not None:
-                zone.name = updates.name
-            if updates.enabled is not None:
-                zone.enabled = updates.enabled
-            if updates.dose is not None:
-                zone.dose = updates.dose
+            for field, value in updates.model_dump(
+                include=_ZONE_ATTR_FIELDS, exclude_none=True
+            ).items():
+                setattr(zone, field, value)
             if updates.hours is not None or updates.minutes is not None or updates.seconds is not None:
                 td = zone.exposure_time
                 total = int(td.total_seconds())
@@ -118,16 +126,14 @@ def update_session_zone(zone_id: str, updates: SessionZoneUpdate, session: Initi
                 )
             if updates.offset is not None:
                 zone.set_offset(updates.offset)
-            if updates.display_mode is not None:
-                zone.display_mode = updates.display_mode
 
             # Calc mode update — delegates to guv_calcs PlaneCalcMode via
             # set_calc_mode(), which sets horiz/vert/use_normal/fov_vert/fov_horiz.
             # Direction is geometry (handled separately below).
-            if updates.calc_mode is not None and isinstance(zone, (CalcPlane, CalcPoint)):
-                if isinstance(zone, CalcPlane) and updates.calc_mode != "custom":
+            if updates.calc_mode is not None and (is_plane or is_point):
+                if is_plane and updates.calc_mode != "custom":
                     zone.set_calc_mode(updates.calc_mode)
-                elif isinstance(zone, CalcPoint):
+                elif is_point:
                     # CalcPoint has no set_calc_mode — apply flags from the mode spec
                     ct = PlaneCalcMode.from_token(updates.calc_mode)
                     if ct is not PlaneCalcMode.CUSTOM:
@@ -145,21 +151,16 @@ def update_session_zone(zone_id: str, updates: SessionZoneUpdate, session: Initi
                     zone.view_target = None
 
             # Plane-specific flag overrides (applied after calc_mode so they win)
-            if updates.fov_vert is not None and hasattr(zone, 'fov_vert'):
-                zone.fov_vert = updates.fov_vert
-            if updates.fov_horiz is not None and hasattr(zone, 'fov_horiz'):
-                zone.fov_horiz = updates.fov_horiz
-            if updates.horiz is not None and hasattr(zone, 'horiz'):
-                zone.horiz = updates.horiz
-            if updates.vert is not None and hasattr(zone, 'vert'):
-                zone.vert = updates.vert
-            if updates.use_normal is not None and hasattr(zone, 'use_normal'):
-                zone.use_normal = updates.use_normal
+            for field, value in updates.model_dump(
+                include=_ZONE_FLAG_FIELDS, exclude_none=True
+            ).items():
+                if hasattr(zone, field):
+                    setattr(zone, field, value)
 
             # View params — mutually exclusive: setting one clears the other.
-            if updates.view_direction is not None and isinstance(zone, CalcPlane):
+            if updates.view_direction is not None and is_plane:
                 zone.view_direction = updates.view_direction
-            if updates.view_target is not None and isinstance(zone, CalcPlane):
+            if updates.view_target is not None and is_plane:
                 zone.view_target = updates.view_target
 
             # Geometry dimension updates — use proper geometry methods instead of
@@ -167,7 +168,7 @@ def update_session_zone(zone_id: str, updates: SessionZoneUpdate, session: Initi
             # Frontend uses different field names for planes (x1/x2/y1/y2) vs
             # volumes (x_min/x_max/y_min/y_max/z_min/z_max), but guv_calcs uses
             # x1/x2/y1/y2/z1/z2 for both.
-            if isinstance(zone, CalcPlane) and zone.geometry is not None:
+            if is_plane and zone.geometry is not None:
                 # Use guv_calcs set_* methods instead of manually rebuilding
                 # PlaneGrid. This preserves correct direction vectors and avoids
                 # the Y-coordinate flip bug caused by PlaneGrid.from_legacy().
@@ -186,7 +187,7 @@ def update_session_zone(zone_id: str, updates: SessionZoneUpdate, session: Initi
                 if updates.direction is not None:
                     zone.set_direction(updates.direction)
 
-            elif isinstance(zone, CalcVol) and zone.geometry is not None:
+            elif is_vol and zone.geometry is not None:
                 # Frontend sends x_min/x_max etc., map to guv_calcs x1/x2 etc.
                 has_vol_change = any(
                     v is not None for v in [
@@ -207,7 +208,7 @@ def update_session_zone(zone_id: str, updates: SessionZoneUpdate, session: Initi
                     z1_val, z2_val = min(z1_val, z2_val), max(z1_val, z2_val)
                     zone.set_dimensions(x1=x1_val, x2=x2_val, y1=y1_val, y2=y2_val, z1=z1_val, z2=z2_val)
 
-            elif isinstance(zone, CalcPoint) and zone.geometry is not None:
+            elif is_point and zone.geometry is not None:
                 position_changed = any(v is not None for v in [updates.x, updates.y, updates.z])
                 aim_changed = any(v is not None for v in [updates.aim_x, updates.aim_y, updates.aim_z])
                 if position_changed:
@@ -218,7 +219,7 @@ def update_session_zone(zone_id: str, updates: SessionZoneUpdate, session: Initi
             # Grid resolution updates — guv_calcs set_num_points/set_spacing now
             # handle mutual exclusion of spacing_init/num_points_init internally.
             # CalcPoint has no grid, so skip resolution updates for it.
-            if not isinstance(zone, CalcPoint):
+            if not is_point:
                 if updates.num_x is not None or updates.num_y is not None or updates.num_z is not None:
                     zone.set_num_points(
                         num_x=updates.num_x,
@@ -292,6 +293,106 @@ def copy_session_zone(zone_id: str, session: InitializedSessionDep):
             _log_and_raise("Failed to copy zone", e)
 
 
+def _zone_fingerprint(zone) -> tuple:
+    """Everything SessionZoneState is derived from, as a comparable tuple.
+
+    calc_state/update_state cover geometry, resolution, offset and view flags,
+    so room-level changes (dimensions, units) that reshape a zone also change
+    its fingerprint.
+    """
+    return (
+        zone.calctype,
+        zone.calc_state,
+        zone.update_state,
+        zone.name,
+        zone.enabled,
+        zone.dose,
+        zone.exposure_time,
+        zone.display_mode,
+    )
+
+
+def _zone_to_state(zone_id: str, zone) -> SessionZoneState:
+    """Build the SessionZoneState for a single guv_calcs zone.
+
+    Plain zone attributes are read from ``zone.__dict__`` and grid attributes
+    through ``zone_grid``: ``getattr(zone, ...)`` on a grid field misses
+    normal lookup and goes through CalcZone.__getattr__'s passthrough.
+
+    Every value comes from guv_calcs, so the model is built with
+    ``model_construct`` rather than re-validating ~45 optional fields.
+    """
+    zd = getattr(zone, '__dict__', {})
+    geom = zone.geometry
+    zone_type = zone.calctype.lower()
+    is_plane = zone_type == "plane"
+    is_point = zone_type == "point"
+    counts, spacing, mins, maxs = zone_grid(zone)
+    h, m, s = _decompose_time(zone)
+    fields = dict(
+        id=zone_id,
+        name=zd.get('name'),
+        type=zone_type,
+        enabled=zd.get('enabled', True),
+        is_standard=zone_id in (EYE_LIMITS, SKIN_LIMITS, WHOLE_ROOM_FLUENCE),
+        num_x=counts[0] if len(counts) > 0 else None,
+        num_y=counts[1] if len(counts) > 1 else None,
+        x_spacing=spacing[0] if len(spacing) > 0 else None,
+        y_spacing=spacing[1] if len(spacing) > 1 else None,
+        offset=getattr(geom, 'offset', True),
+        dose=zd.get('dose', False),
+        hours=h,
+        minutes=m,
+        seconds=s,
+        display_mode=zd.get('display_mode', 'heatmap'),
+    )
+    if is_plane:
+        fields.update(
+            calc_mode=zone.calc_mode,
+            height=getattr(geom, 'height', None),
+            x1=mins[0] if len(mins) > 0 else None,
+            y1=mins[1] if len(mins) > 1 else None,
+            x2=maxs[0] if len(maxs) > 0 else None,
+            y2=maxs[1] if len(maxs) > 1 else None,
+            horiz=zd.get('horiz', False),
+            vert=zd.get('vert', False),
+            use_normal=zd.get('use_normal', False),
+            fov_vert=zd.get('fov_vert', 180),
+            fov_horiz=zd.get('fov_horiz', 360),
+            view_direction=zd.get('_view_direction'),
+            view_target=zd.get('_view_target'),
+            direction=getattr(geom, 'direction', 1),
+            ref_surface=getattr(geom, 'ref_surface', 'xy'),
+        )
+    elif is_point:
+        x, y, z = getattr(geom, 'position', (None, None, None))
+        aim_x, aim_y, aim_z = getattr(geom, 'aim_point', (None, None, None))
+        fields.update(
+            x=x, y=y, z=z,
+            aim_x=aim_x, aim_y=aim_y, aim_z=aim_z,
+            horiz=zd.get('horiz', True),
+            vert=zd.get('vert', False),
+            use_normal=zd.get('use_normal', True),
+            fov_vert=zd.get('fov_vert', 180),
+            fov_horiz=zd.get('fov_horiz', 360),
+            calc_mode=zone.calc_mode,
+        )
+    else:
+        fields.update(
+            num_z=counts[2] if len(counts) > 2 else None,
+            z_spacing=spacing[2] if len(spacing) > 2 else None,
+            x_min=mins[0] if len(mins) > 0 else None,
+            y_min=mins[1] if len(mins) > 1 else None,
+            z_min=mins[2] if len(mins) > 2 else None,
+            x_max=maxs[0] if len(maxs) > 0 else None,
+            y_max=maxs[1] if len(maxs) > 1 else None,
+            z_max=maxs[2] if len(maxs) > 2 else None,
+        )
+    # One construct call: SessionZoneState is frozen, since instances are
+    # cached on the session and shared across responses.
+    return SessionZoneState.model_construct(**fields)
+
+
 @router.get("/zones", response_model=GetZonesResponse)
 def get_session_zones(session: InitializedSessionDep):
     """Get current zone state from session.room.calc_zones.
@@ -299,72 +400,27 @@ def get_session_zones(session: InitializedSessionDep):
     Returns the authoritative zone state from guv_calcs, which is useful after
     room property changes that trigger automatic zone updates (dimensions, units, standard).
 
+    Per-zone states are cached on the session and reused while the zone's
+    fingerprint is unchanged, so repeat polls skip the attribute probing.
+
     Requires X-Session-ID header.
     """
     zones = []
+    previous = session.zone_state_cache
+    cache = {}
     # Snapshot to avoid RuntimeError if a concurrent request mutates calc_zones
     for zone_id, zone in list(session.room.calc_zones.items()):
-        zone_type = zone.calctype.lower()
-        is_plane = zone_type == "plane"
-        is_point = zone_type == "point"
-        h, m, s = _decompose_time(zone)
-        zone_state = SessionZoneState(
-            id=zone_id,
-            name=getattr(zone, 'name', None),
-            type=zone_type,
-            enabled=getattr(zone, 'enabled', True),
-            is_standard=zone_id in (EYE_LIMITS, SKIN_LIMITS, WHOLE_ROOM_FLUENCE),
-            num_x=getattr(zone, 'num_x', None),
-            num_y=getattr(zone, 'num_y', None),
-            x_spacing=getattr(zone, 'x_spacing', None),
-            y_spacing=getattr(zone, 'y_spacing', None),
-            offset=getattr(zone, 'offset', True),
-            dose=getattr(zone, 'dose', False),
-            hours=h,
-            minutes=m,
-            seconds=s,
-            display_mode=getattr(zone, 'display_mode', 'heatmap'),
-        )
-        if is_plane:
-            zone_state.calc_mode = zone.calc_mode
-            zone_state.height = zone.height
-            zone_state.x1 = zone.x1
-            zone_state.x2 = zone.x2
-            zone_state.y1 = zone.y1
-            zone_state.y2 = zone.y2
-            zone_state.horiz = getattr(zone, 'horiz', False)
-            zone_state.vert = getattr(zone, 'vert', False)
-            zone_state.use_normal = getattr(zone, 'use_normal', False)
-            zone_state.fov_vert = getattr(zone, 'fov_vert', 180)
-            zone_state.fov_horiz = getattr(zone, 'fov_horiz', 360)
-            zone_state.view_direction = getattr(zone, 'view_direction', None)
-            zone_state.view_target = getattr(zone, 'view_target', None)
-            zone_state.direction = getattr(zone, 'direction', 1)
-            zone_state.ref_surface = getattr(zone, 'ref_surface', 'xy')
-        elif is_point:
-            zone_state.x = zone.position[0]
-            zone_state.y = zone.position[1]
-            zone_state.z = zone.position[2]
-            zone_state.aim_x = zone.aim_point[0]
-            zone_state.aim_y = zone.aim_point[1]
-            zone_state.aim_z = zone.aim_point[2]
-            zone_state.horiz = getattr(zone, 'horiz', True)
-            zone_state.vert = getattr(zone, 'vert', False)
-            zone_state.use_normal = getattr(zone, 'use_normal', True)
-            zone_state.fov_vert = getattr(zone, 'fov_vert', 180)
-            zone_state.fov_horiz = getattr(zone, 'fov_horiz', 360)
-            zone_state.calc_mode = getattr(zone, 'calc_mode', None)
+        fingerprint = _zone_fingerprint(zone)
+        cached = previous.get(zone_id)
+        if cached is not None and cached[0] == fingerprint:
+            zone_state = cached[1]
         else:
-            zone_state.num_z = getattr(zone, 'num_z', None)
-            zone_state.z_spacing = getattr(zone, 'z_spacing', None)
-            zone_state.x_min = zone.x1
-            zone_state.x_max = zone.x2
-            zone_state.y_min = zone.y1
-            zone_state.y_max = zone.y2
-            zone_state.z_min = zone.z1
-            zone_state.z_max = zone.z2
+            zone_state = _zone_to_state(zone_id, zone)
+        cache[zone_id] = (fingerprint, zone_state)
         zones.append(zone_state)
-    return GetZonesResponse(zones=zones)
+    # Rebuilt each call so deleted zones drop out of the cache
+    session.zone_state_cache = cache
+    return GetZonesResponse.model_construct(zones=zones)
 
 
 @router.get("/zones/{zone_id}/export")
@@ -407,21 +463,33 @@ def export_session_zone(zone_id: str, session: InitializedSessionDep):
         _log_and_raise("Zone export failed", e)
 
 
-@router.get("/zones/{zone_id}/plot")
-def get_zone_plot(
+@router.get("/zones/{zone_id}/plot", response_class=NumpyJSONResponse)
+async def get_zone_plot(
     zone_id: str,
     session: InitializedSessionDep,
     theme: str = "dark",
-    dpi: int = 100
+    dpi: int = 100,
+    image_format: ImageFormat = Query("png", alias="format"),
 ):
     """
-    Get a zone's calculation plot as PNG image.
+    Get a zone's calculation plot as a base64 image (PNG by default).
 
     Uses zone.plot() to generate a visualization of the calculated values.
     Handles both Plane zones (Matplotlib) and Volume zones (Plotly).
 
     Requires X-Session-ID header.
     """
+    return await run_plot(_render_zone_plot, zone_id, session, theme, dpi, image_format)
+
+
+def _render_zone_plot(
+    zone_id: str,
+    session: Session,
+    theme: str,
+    dpi: int,
+    image_format: ImageFormat,
+):
+    """Render a zone plot; runs on the plot pool."""
     zone = _get_zone_or_404(session, zone_id)
 
     if zone.values is None:
@@ -456,18 +524,8 @@ def get_zone_plot(
                     if title:
                         ax.set_title(title, fontsize=16)
 
-                # Convert to base64
-                buf = io.BytesIO()
-                fig.savefig(buf, format='png', dpi=dpi, bbox_inches='tight',
-                            facecolor=bg_color, edgecolor='none')
-                buf.seek(0)
-
-            image_base64 = base64.b64encode(buf.read()).decode('utf-8')
-
-            return {
-                "image_base64": image_base64,
-                "content_type": "image/png"
-            }
+                return fig_to_image(fig, image_format, dpi=dpi, bbox_inches='tight',
+                                    facecolor=bg_color, edgecolor='none')
         finally:
             if fig is not None:
                 plt.close(fig)
@@ -1,5 +1,7 @@
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 import os
 import sys
 
@@ -29,4 +31,15 @@ def setup_logging():
         stream_handler.setFormatter(formatter)
         handlers.append(stream_handler)
 
-        logging.basicConfig(level=logging.INFO, handlers=handlers)
+        # Request handlers only enqueue records; a background listener thread
+        # does the file/stderr writes (and rotation) off the request path.
+        log_queue = queue.SimpleQueue()
+        listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        listener.start()
+        atexit.register(listener.stop)
+
+        # Only the message (plus traceback) is rendered at enqueue time; the
+        # listener's handlers apply the real format.
+        queue_handler = QueueHandler(log_queue)
+        queue_handler.setFormatter(logging.Formatter('%(message)s'))
+        logging.basicConfig(level=logging.INFO, handlers=[queue_handler])
@@ -12,7 +12,7 @@ from .logging_config import setup_logging
 # Import routers
 from api.v1.utility_routers import utility_router
 from api.v1.lamp_routers import lamp_router
-from api.v1.efficacy_routers import router as efficacy_router
+from api.v1.efficacy_routers import router as efficacy_router, warm_efficacy_cache
 from api.v1.session_routers import router as session_router
 from api.v1.session_manager import init_session_manager, get_session_manager
 
@@ -43,6 +43,7 @@ async def lifespan(app: FastAPI):
     """Application lifespan - startup and shutdown."""
     # Startup
     init_session_manager()
+    warm_efficacy_cache()
     yield
     # Shutdown
     get_session_manager().stop_cleanup()
@@ -0,0 +1,44 @@
+"""Pre-render preset lamp info into the on-disk lamp info cache.
+
+Run via: uv run python scripts/build_lamp_info_cache.py
+Renders every built-in preset in both themes (with hi-res images), and
+triangulates each preset's photometric web, into LAMP_INFO_CACHE_DIR, so a
+process started against that directory loads them from disk instead of
+running matplotlib or Delaunay. The Docker image runs this at build time;
+entries are keyed by library versions, so a stale directory is simply
+ignored after an upgrade.
+"""
+import os
+import sys
+import time
+from pathlib import Path
+
+# See export_openapi.py: make `api` importable when run as a plain script.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# The background pre-warm would race this script for the same renders.
+os.environ["PREWARM_LAMP_INFO"] = "false"
+
+from api.v1 import lamp_routers  # noqa: E402
+
+
+def main() -> None:
+    if not lamp_routers.LAMP_INFO_CACHE_DIR:
+        sys.exit("LAMP_INFO_CACHE_DIR is empty; nothing to build")
+    start = time.perf_counter()
+    lamp_routers._prewarm_cache()
+    for preset_id in lamp_routers.VALID_LAMPS:
+        lamp_routers._compute_photometric_topology(preset_id, None, None, None, "meters")
+    cache_dir = Path(lamp_routers.LAMP_INFO_CACHE_DIR)
+    count = sum(1 for p in cache_dir.iterdir() if p.suffix in (".json", ".npy"))
+    print(f"Wrote {count} entries to {lamp_routers.LAMP_INFO_CACHE_DIR} "
+          f"in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
+    # Same native-extension teardown crash as export_openapi.py; the cache is
+    # fully written by now, so skip the finalizers.
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os._exit(0)
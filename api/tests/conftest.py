@@ -17,6 +17,7 @@ Fixture composition:
       → reflectance_session
 """
 
+import os
 import pathlib
 
 import pytest
@@ -24,7 +25,12 @@ from unittest.mock import patch
 
 from starlette.testclient import TestClient
 
-from app.main import app
+# Keep test runs from reading or writing the on-disk preset plot cache, and
+# render preset plots on demand instead of in a background thread
+os.environ.setdefault("LAMP_INFO_CACHE_DIR", "")
+os.environ.setdefault("PREWARM_LAMP_INFO", "false")
+
+from app.main import app  # noqa: E402
 
 API = "/api/v1"
 
@@ -1,5 +1,9 @@
 """Efficacy/pathogen data endpoint tests."""
 
+import json
+
+import pytest
+
 from tests.conftest import API
 
 
@@ -14,6 +18,29 @@ class TestEfficacySummary:
         assert "pathogens" in data
         assert len(data["pathogens"]) >= 1
 
+    def test_malformed_json_body_is_422(self, client):
+        """Bodies are decoded with orjson; decode errors keep FastAPI's 422 shape."""
+        resp = client.post(
+            f"{API}/efficacy/summary",
+            content=b'{"fluence": 10.0,',
+            headers={"Content-Type": "application/json"},
+        )
+        assert resp.status_code == 422
+        assert resp.json()["detail"][0]["type"] == "json_invalid"
+
+    def test_summary_times_for_single_phase_rows(self, client):
+        """Rows without k2 decay single-phase: log-times scale 1:2:3, not ~0."""
+        resp = client.post(
+            f"{API}/efficacy/summary",
+            json={"fluence": 10.0, "wavelength": 222},
+        )
+        for pathogen in resp.json()["pathogens"]:
+            if pathogen["log1_seconds"] is None:
+                continue
+            assert pathogen["log1_seconds"] > 1e-3
+            assert pathogen["log2_seconds"] == pytest.approx(2 * pathogen["log1_seconds"])
+            assert pathogen["log3_seconds"] == pytest.approx(3 * pathogen["log1_seconds"])
+
 
 class TestEfficacyTable:
     def test_table_returns_rows(self, client):
@@ -27,6 +54,18 @@ class TestEfficacyTable:
         assert "rows" in data
         assert data["count"] > 0
 
+    def test_table_ndjson_matches_json_rows(self, client):
+        table = client.post(f"{API}/efficacy/table", json={"fluence": 10.0}).json()
+        resp = client.post(
+            f"{API}/efficacy/table?format=ndjson",
+            json={"fluence": 10.0},
+        )
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("application/x-ndjson")
+        records = [json.loads(line) for line in resp.text.splitlines()]
+        assert len(records) == table["count"]
+        assert records[0] == dict(zip(table["columns"], table["rows"][0]))
+
 
 class TestEfficacyExplore:
     def test_explore_returns_categories_and_table(self, client):
@@ -107,6 +146,17 @@ class TestEfficacyStats:
         data = resp.json()
         assert data["wavelength"] == 222
 
+    def test_stats_medium_alias_matches_canonical_name(self, client):
+        """Medium filters keep guv_calcs' word matching, aliases included."""
+        def stats(medium):
+            data = client.post(
+                f"{API}/efficacy/stats",
+                json={"fluence": 10.0, "medium": medium},
+            ).json()
+            data.pop("medium")
+            return data
+        assert stats("air") == stats("Aerosol")
+
 
 # ============================================================
 # Species endpoint
@@ -1,5 +1,9 @@
 """Lamp catalog endpoint tests (no session needed)."""
 
+import base64
+
+import pytest
+
 from tests.conftest import API
 
 
@@ -24,6 +28,16 @@ class TestLampOptions:
             assert "id" in p
             assert "name" in p
 
+    def test_etag_revalidation(self, client):
+        resp = client.get(f"{API}/lamps/options")
+        etag = resp.headers["etag"]
+        cached = client.get(f"{API}/lamps/options", headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.content == b""
+        stale = client.get(f"{API}/lamps/options", headers={"If-None-Match": '"stale"'})
+        assert stale.status_code == 200
+        assert stale.json() == resp.json()
+
 
 class TestLampPresetDetails:
     def test_valid_preset_returns_details(self, client):
@@ -49,6 +63,13 @@ class TestValidatePreset:
         assert resp.status_code == 200
         assert resp.json()["valid"] is False
 
+    def test_head_preset_probe(self, client):
+        found = client.head(f"{API}/lamps/presets/USHIO_B1")
+        assert found.status_code == 200
+        assert found.content == b""
+        assert client.head(f"{API}/lamps/presets/custom").status_code == 200
+        assert client.head(f"{API}/lamps/presets/nonexistent_lamp").status_code == 404
+
 
 class TestLampInfo:
     def test_returns_plots_and_power(self, client):
@@ -63,6 +84,97 @@ class TestLampInfo:
         resp = client.get(f"{API}/lamps/info/nonexistent_lamp")
         assert resp.status_code == 404
 
+    def test_webp_format(self, client):
+        resp = client.get(
+            f"{API}/lamps/info/ushio_b1",
+            params={"format": "webp", "include_hires": False},
+        )
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["content_type"] == "image/webp"
+        assert base64.b64decode(data["photometric_plot_base64"])[8:12] == b"WEBP"
+
+    def test_unknown_theme_shares_dark_cache_entry(self, client):
+        from api.v1.lamp_routers import _generate_preset_lamp_info
+
+        params = {"include_hires": False}
+        dark = client.get(f"{API}/lamps/info/ushio_b1", params={**params, "theme": "dark"})
+        size = _generate_preset_lamp_info.cache_info().currsize
+        other = client.get(f"{API}/lamps/info/ushio_b1", params={**params, "theme": "sepia"})
+        assert other.json() == dark.json()
+        assert _generate_preset_lamp_info.cache_info().currsize == size
+
+    def test_preset_info_round_trips_through_disk_cache(self, tmp_path, monkeypatch):
+        from api.v1 import lamp_routers
+
+        monkeypatch.setattr(lamp_routers, "LAMP_INFO_CACHE_DIR", str(tmp_path))
+        render = lamp_routers._generate_preset_lamp_info.__wrapped__
+        first = render("ushio_b1", "light", False)
+        assert len(list(tmp_path.glob("*.json"))) == 1
+
+        def fail(*args):
+            raise AssertionError("rendered despite a disk cache hit")
+        monkeypatch.setattr(lamp_routers, "_render_preset_lamp_info", fail)
+        assert render("ushio_b1", "light", False) == first
+
+
+class TestBytesBoundedLRU:
+    def test_evicts_oldest_entries_past_the_byte_budget(self):
+        from api.v1.lamp_routers import _bytes_lru
+
+        calls = []
+
+        @_bytes_lru(max_bytes=10, sizeof=len)
+        def make(key, size):
+            calls.append(key)
+            return "x" * size
+
+        make("a", 4)
+        make("b", 4)
+        make("a", 4)  # hit; "b" is now the oldest
+        make("c", 4)
+        assert make.cache_info().currsize == 2
+        assert make.cache_info().currbytes == 8
+        make("a", 4)
+        make("b", 4)
+        assert calls == ["a", "b", "c", "b"]
+
+    def test_oversized_values_are_not_cached(self):
+        from api.v1.lamp_routers import _bytes_lru
+
+        @_bytes_lru(max_bytes=10, sizeof=len)
+        def make(size):
+            return "x" * size
+
+        make(11)
+        assert make.cache_info().currsize == 0
+
+
+class TestSingleFlight:
+    def test_concurrent_callers_share_one_call(self):
+        import asyncio
+        import threading
+
+        from api.v1.lamp_routers import _inflight, _single_flight
+
+        calls = []
+        release = threading.Event()
+
+        def slow(x):
+            calls.append(x)
+            release.wait(5)
+            return x * 2
+
+        async def run():
+            waiters = [asyncio.ensure_future(_single_flight(slow, 21)) for _ in range(5)]
+            await asyncio.sleep(0.05)
+            release.set()
+            return await asyncio.gather(*waiters)
+
+        assert asyncio.run(run()) == [42] * 5
+        assert calls == [21]
+        assert not _inflight
+
 
 class TestCatalogPhotometricWeb:
     def test_returns_mesh_data(self, client):
@@ -76,6 +188,98 @@ class TestCatalogPhotometricWeb:
         assert "triangles" in data
         assert len(data["vertices"]) > 0
 
+    def test_scaling_factor_scales_vertices_only(self, client):
+        def web(scaling_factor):
+            return client.post(
+                f"{API}/lamps/photometric-web",
+                json={"preset_id": "ushio_b1", "scaling_factor": scaling_factor},
+            ).json()
+        base, doubled = web(1.0), web(2.0)
+        assert doubled["triangles"] == base["triangles"]
+        assert doubled["surface_points"] == base["surface_points"]
+        assert [c for v in doubled["vertices"] for c in v] == pytest.approx(
+            [2 * c for v in base["vertices"] for c in v]
+        )
+
+    def test_source_settings_leave_cached_lamp_untouched(self):
+        from api.v1.lamp_routers import _compute_photometric_topology, _preset_web_lamp
+
+        surface = _preset_web_lamp("ushio_b1").surface
+        before = (surface.source_density, surface.width, surface.length)
+        _compute_photometric_topology.__wrapped__("ushio_b1", 7, 0.3, 0.2, "feet")
+        assert (surface.source_density, surface.width, surface.length) == before
+
+    def test_triangulation_shared_across_source_settings(self, monkeypatch):
+        from api.v1 import lamp_routers
+        from api.v1.utils import triangulation
+
+        topology = lamp_routers._compute_photometric_topology.__wrapped__
+        first = topology("beacon", None, None, None, "meters")
+
+        def fail(*args):
+            raise AssertionError("re-triangulated for new source settings")
+        monkeypatch.setattr(triangulation, "Delaunay", fail)
+        assert topology("beacon", 9, 0.4, 0.2, "feet")["triangles"] == first["triangles"]
+
+    def test_binary_mesh_matches_json(self, client):
+        import numpy as np
+
+        body = {"preset_id": "ushio_b1", "scaling_factor": 0.5}
+        data = client.post(f"{API}/lamps/photometric-web", json=body).json()
+        resp = client.post(f"{API}/lamps/photometric-web.bin", json=body)
+        assert resp.status_code == 200
+        assert resp.headers["content-type"] == "application/octet-stream"
+
+        buf = resp.content
+        n_verts, n_tris = np.frombuffer(buf, dtype="<u4", count=2)
+        vertices = np.frombuffer(buf, dtype="<f4", count=3 * n_verts, offset=8)
+        triangles = np.frombuffer(buf, dtype="<u4", offset=8 + 12 * n_verts)
+        assert len(buf) == 8 + 12 * (n_verts + n_tris)
+        np.testing.assert_allclose(vertices.reshape(-1, 3), data["vertices"], rtol=1e-6)
+        assert triangles.reshape(-1, 3).tolist() == data["triangles"]
+
+    def test_binary_invalid_returns_400(self, client):
+        resp = client.post(
+            f"{API}/lamps/photometric-web.bin",
+            json={"preset_id": "nonexistent_lamp"},
+        )
+        assert resp.status_code == 400
+
+    def test_preset_triangulation_round_trips_through_disk_cache(self, tmp_path, monkeypatch):
+        import numpy as np
+
+        from api.v1 import lamp_routers
+        from api.v1.utils import triangulation
+
+        monkeypatch.setattr(lamp_routers, "LAMP_INFO_CACHE_DIR", str(tmp_path))
+        triangulation._triangulate.cache_clear()
+        first = lamp_routers._preset_simplices.__wrapped__("ushio_b1")
+        assert len(list(tmp_path.glob("tri_*.npy"))) == 1
+
+        def fail(*args):
+            raise AssertionError("triangulated despite a disk cache hit")
+        monkeypatch.setattr(triangulation, "Delaunay", fail)
+        triangulation._triangulate.cache_clear()
+        np.testing.assert_array_equal(lamp_routers._preset_simplices.__wrapped__("ushio_b1"), first)
+
+    def test_session_lamp_reuses_preset_triangulation(self, lamp_with_ies_session, tmp_path, monkeypatch):
+        from api.v1 import lamp_routers
+        from api.v1.utils import triangulation
+
+        client, headers, lamp_id = lamp_with_ies_session
+        preset = lamp_routers._preset_simplices.__wrapped__("ushio_b1")
+
+        def fail(*args):
+            raise AssertionError("re-triangulated a preset's photometry")
+        monkeypatch.setattr(triangulation, "Delaunay", fail)
+        # Session lamps can carry arbitrary uploaded photometry, so their
+        # triangulations must never be written to the disk cache.
+        monkeypatch.setattr(lamp_routers, "LAMP_INFO_CACHE_DIR", str(tmp_path))
+        resp = client.get(f"{API}/session/lamps/{lamp_id}/photometric-web", headers=headers)
+        assert resp.status_code == 200
+        assert resp.json()["triangles"] == preset.tolist()
+        assert not list(tmp_path.iterdir())
+
     def test_invalid_returns_400(self, client):
         resp = client.post(
             f"{API}/lamps/photometric-web",
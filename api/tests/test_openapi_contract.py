@@ -0,0 +1,14 @@
+"""The committed OpenAPI contract must match the app's schema."""
+
+import json
+from pathlib import Path
+
+from app.main import app
+
+OPENAPI_PATH = Path(__file__).resolve().parent.parent / "openapi.json"
+
+
+def test_committed_openapi_matches_app():
+    committed = json.loads(OPENAPI_PATH.read_text())
+    current = json.loads(json.dumps(app.openapi()))
+    assert committed == current, "api/openapi.json is stale; run `make generate-api` and commit"
@@ -26,6 +26,7 @@ from guv_calcs.performance import (
 def _make_zone(num_points=(5, 5), enabled=True, calctype="plane", name="test"):
     zone = MagicMock()
     zone.num_points = num_points
+    zone.geometry.axes = [MagicMock(points=range(n)) for n in num_points]
     zone.enabled = enabled
     zone.calctype = calctype
     zone.name = name
@@ -177,6 +178,19 @@ class TestCheckBudget:
         # Should not raise
         check_budget(session)
 
+    def test_under_budget_returns_estimate_without_zone_breakdown(self):
+        session = _make_session(zones=[_make_zone(num_points=(5, 5))])
+        full = estimate_session_cost(session)
+        full.pop("zones")
+        assert check_budget(session) == full
+
+    def test_over_budget_detail_includes_zone_breakdown(self):
+        session = _make_session(zones=[_make_zone(num_points=(5, 5), name="desk")])
+        session.room.estimate_calculation_time.return_value = MAX_CALC_TIME_SECONDS + 100
+        with pytest.raises(HTTPException) as exc_info:
+            check_budget(session)
+        assert [z["name"] for z in exc_info.value.detail["breakdown"]["zones"]] == ["desk"]
+
     def test_over_memory_raises_400(self):
         """A massive reflectance grid should exceed memory limit."""
         zone = _make_zone(num_points=(100, 100))
@@ -311,6 +325,20 @@ class TestBudgetHTTPIntegration:
         assert after["memory_percent"] > before["memory_percent"]
 
 
+# ============================================================
+# Zone grid points
+# ============================================================
+
+class TestZoneGridPoints:
+    @pytest.mark.parametrize("zone_cls", ["CalcPlane", "CalcVol", "CalcPoint"])
+    def test_matches_geometry_num_points(self, zone_cls):
+        import guv_calcs.calc_zone as calc_zone
+        from api.v1.resource_limits import zone_grid_points
+
+        zone = getattr(calc_zone, zone_cls)(zone_id="z")
+        assert zone_grid_points(zone) == prod(zone.geometry.num_points)
+
+
 # ============================================================
 # Resource limit constants
 # ============================================================
@@ -604,3 +604,17 @@ class TestMultipleZonesInit:
         assert len(planes) == 2
         modes = {z["calc_mode"] for z in planes}
         assert modes == {"fluence_rate", "eye_directional"}
+
+
+class TestLoadedZoneWithoutGeometry:
+    @pytest.mark.parametrize("zone_cls", ["CalcPlane", "CalcVol"])
+    def test_grid_fields_are_none(self, zone_cls):
+        import guv_calcs.calc_zone as calc_zone
+        from api.v1.session_helpers import _zone_to_loaded
+
+        zone = getattr(calc_zone, zone_cls)(zone_id="bare")
+        zone._geometry = None
+        loaded = _zone_to_loaded(zone, "bare")
+        assert loaded.num_x is None
+        assert loaded.x_spacing is None
+        assert loaded.offset is None
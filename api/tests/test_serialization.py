@@ -0,0 +1,22 @@
+"""JSON serialization helper tests."""
+
+import numpy as np
+
+from api.v1.utils.serialization import _STREAM_CHUNK_VALUES, dumps, iter_json
+
+
+class TestIterJson:
+    def test_matches_dumps(self):
+        content = {
+            "nested": {"grid": np.arange(3 * _STREAM_CHUNK_VALUES, dtype=np.float64).reshape(-1, 3)},
+            "values": np.array([1.5, np.nan, -2.0]),
+            "nan": float("nan"),
+            None: "none key",
+            True: "bool key",
+            7: {1.5: [1, 2, {"deep": None}]},
+        }
+        assert b"".join(iter_json(content)) == dumps(content)
+
+    def test_small_flush_size_matches_dumps(self):
+        content = {"a": np.ones((40, 3)), "b": [{"c": 1}, {"d": 2}]}
+        assert b"".join(iter_json(content, flush_bytes=16)) == dumps(content)
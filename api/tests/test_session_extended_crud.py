@@ -632,3 +632,17 @@ class TestPlaneZoneGeometry:
         # Volume zone plot should return 400
         resp = client.get(f"{API}/session/zones/{zone_id}/plot", headers=session_headers)
         assert resp.status_code == 400
+
+
+class TestZoneStateWithoutGeometry:
+    @pytest.mark.parametrize("zone_cls", ["CalcPlane", "CalcVol", "CalcPoint"])
+    def test_grid_fields_are_none(self, zone_cls):
+        import guv_calcs.calc_zone as calc_zone
+        from api.v1.zone_session_routers import _zone_to_state
+
+        zone = getattr(calc_zone, zone_cls)(zone_id="bare")
+        zone._geometry = None
+        state = _zone_to_state("bare", zone)
+        assert state.num_x is None
+        assert state.x_spacing is None
+        assert state.x1 is None and state.x_min is None and state.x is None
@@ -23,6 +23,34 @@ class TestSessionLampInfo:
         png_bytes = base64.b64decode(data["photometric_plot_base64"])
         assert png_bytes[:4] == b"\x89PNG"
 
+    def test_repeat_plots_are_reused_per_theme(self, lamp_with_ies_session):
+        client, headers, lamp_id = lamp_with_ies_session
+        url = f"{API}/session/lamps/{lamp_id}/info/plots"
+        first = client.get(url, headers=headers).json()
+        again = client.get(url, headers=headers).json()
+        assert again == first
+        light = client.get(url, params={"theme": "light"}, headers=headers).json()
+        assert light["photometric_plot_base64"] != first["photometric_plot_base64"]
+
+    def test_plot_cache_keys_are_normalized(self, lamp_with_ies_session):
+        from api.v1.session_manager import get_session_manager
+
+        client, headers, lamp_id = lamp_with_ies_session
+        url = f"{API}/session/lamps/{lamp_id}/info/plots"
+        session = get_session_manager().get_session(headers["X-Session-ID"])
+        client.get(url, params={"dpi": 150, "include_hires": False}, headers=headers)
+        size = len(session.lamp_plot_cache[lamp_id][1])
+        for theme in ("dark", "sepia", "theme150"):
+            params = {"dpi": 150, "theme": theme, "include_hires": False}
+            assert client.get(url, params=params, headers=headers).status_code == 200
+        assert len(session.lamp_plot_cache[lamp_id][1]) == size
+
+    def test_unsupported_dpi_returns_422(self, lamp_with_ies_session):
+        client, headers, lamp_id = lamp_with_ies_session
+        url = f"{API}/session/lamps/{lamp_id}/info/plots"
+        for dpi in (72, 200):
+            assert client.get(url, params={"dpi": dpi}, headers=headers).status_code == 422
+
     def test_no_ies_returns_info(self, custom_lamp_session):
         """Lamp without IES still returns info (plots may be absent)."""
         client, headers, lamp_id = custom_lamp_session
@@ -130,6 +130,20 @@ class TestZonePlot:
         resp = client.get(f"{API}/session/zones/nonexistent/plot", headers=headers)
         assert resp.status_code == 404
 
+    def test_svg_and_webp_formats(self, calculated_session):
+        client, headers, calc_data = calculated_session
+        zone_id = list(calc_data["zones"].keys())[0]
+        url = f"{API}/session/zones/{zone_id}/plot"
+
+        data = client.get(url, params={"format": "svg"}, headers=headers).json()
+        assert data["content_type"] == "image/svg+xml"
+        assert b"<svg" in base64.b64decode(data["image_base64"])
+
+        data = client.get(url, params={"format": "webp"}, headers=headers).json()
+        assert data["content_type"] == "image/webp"
+        image = base64.b64decode(data["image_base64"])
+        assert image[:4] == b"RIFF" and image[8:12] == b"WEBP"
+
 
 class TestSurvivalPlot:
     def test_returns_base64_png(self, calculated_session):
@@ -149,6 +149,28 @@ class TestZoneCRUD:
         assert "zones" in data
         assert len(data["zones"]) >= 1
 
+    def test_list_zones_reflects_updates_after_repeat_get(self, initialized_session):
+        client, headers = initialized_session
+        zones = client.get(f"{API}/session/zones", headers=headers).json()["zones"]
+        plane = next(z for z in zones if z["type"] == "plane")
+
+        resp = client.patch(
+            f"{API}/session/zones/{plane['id']}",
+            json={"name": "Renamed", "num_x": 7},
+            headers=headers,
+        )
+        assert resp.status_code == 200
+
+        zones = client.get(f"{API}/session/zones", headers=headers).json()["zones"]
+        updated = next(z for z in zones if z["id"] == plane["id"])
+        assert updated["name"] == "Renamed"
+        assert updated["num_x"] == 7
+
+        resp = client.delete(f"{API}/session/zones/{plane['id']}", headers=headers)
+        assert resp.status_code == 200
+        zones = client.get(f"{API}/session/zones", headers=headers).json()["zones"]
+        assert all(z["id"] != plane["id"] for z in zones)
+
 
 # ============================================================
 # Room mutations
@@ -200,6 +222,19 @@ class TestCalculateResults:
                 if isinstance(values[0], list):
                     assert all(isinstance(row, list) for row in values)
 
+    def test_zone_values_match_num_points(self, calculated_session):
+        _client, _headers, data = calculated_session
+        for zone_id, zone in data["zones"].items():
+            if zone.get("values") is None:
+                continue
+            shape = []
+            level = zone["values"]
+            while isinstance(level, list):
+                shape.append(len(level))
+                level = level[0]
+            assert shape == zone["num_points"]
+            assert isinstance(level, float)
+
     def test_mean_fluence_is_positive(self, calculated_session):
         _client, _headers, data = calculated_session
         # mean_fluence comes from WholeRoomFluence zone; may be None if
@@ -301,6 +336,27 @@ class TestZoneEdgeCases:
         )
         assert resp.status_code == 200
 
+    def test_init_standard_zones_keep_per_zone_flags(
+        self, client, session_headers, minimal_room_config
+    ):
+        resp = client.post(
+            f"{API}/session/init",
+            json={
+                "room": minimal_room_config,
+                "zones": [
+                    {"id": "WholeRoomFluence", "type": "plane", "isStandard": True,
+                     "height": 1.2, "enabled": False},
+                    {"id": "EyeLimits", "type": "plane", "isStandard": True, "height": 1.8},
+                    {"id": "SkinLimits", "type": "plane", "isStandard": True, "height": 1.8},
+                ],
+            },
+            headers=session_headers,
+        )
+        assert resp.status_code == 200
+        zones = client.get(f"{API}/session/zones", headers=session_headers).json()["zones"]
+        enabled = {z["id"]: z["enabled"] for z in zones}
+        assert enabled == {"WholeRoomFluence": False, "EyeLimits": True, "SkinLimits": True}
+
     def test_copy_zone_preserves_dimensions(self, initialized_session):
         client, headers = initialized_session
         status = client.get(f"{API}/session/status", headers=headers).json()
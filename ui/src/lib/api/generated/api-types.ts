@@ -38,7 +38,8 @@ export interface paths {
          * @description Consolidated endpoint for the Explore Data modal.
          *
          *     Returns metadata (categories, mediums, wavelengths) and the full table
-         *     in a single response, avoiding 4 separate round-trips.
+         *     in a single response, avoiding 4 separate round-trips. The body is
+         *     cached per fluence.
          */
         post: operations["get_explore_data_api_v1_efficacy_explore_post"];
         delete?: never;
@@ -147,6 +148,11 @@ export interface paths {
          *     Returns all base columns plus computed columns from the efficacy database,
          *     filtered by wavelength, medium, and/or category. Uses full_df to avoid
          *     the display column selection that table() performs.
+         *
+         *     With ``?format=ndjson`` the rows are streamed as newline-delimited
+         *     ``{column: value}`` objects instead of one columns/rows document.
+         *
+         *     JSON bodies are cached per (fluence, wavelength, medium, category).
          */
         post: operations["get_efficacy_table_api_v1_efficacy_table_post"];
         delete?: never;
@@ -295,6 +301,26 @@ export interface paths {
         patch?: never;
         trace?: never;
     };
+    "/api/v1/lamps/photometric-web.bin": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        get?: never;
+        put?: never;
+        /**
+         * Get the photometric web mesh for a preset lamp as binary buffers
+         * @description Same mesh as /lamps/photometric-web, packed for direct upload to a GPU buffer: a little-endian uint32 vertex count and triangle count, then float32 [x, y, z] vertices, then uint32 [i, j, k] triangle indices. Only the mesh is included; fetch the JSON endpoint for the aim line, surface points and fixture bounds.
+         */
+        post: operations["get_preset_photometric_web_binary_api_v1_lamps_photometric_web_bin_post"];
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
     "/api/v1/lamps/presets": {
         parameters: {
             query?: never;
@@ -331,7 +357,11 @@ export interface paths {
         post?: never;
         delete?: never;
         options?: never;
-        head?: never;
+        /**
+         * Check that a preset exists
+         * @description Cheap existence probe: 200 if the preset (or 'custom') is known, 404 otherwise, with no body. Prefer this over validate-preset for checks.
+         */
+        head: operations["head_preset_api_v1_lamps_presets__preset_id__head"];
         patch?: never;
         trace?: never;
     };
@@ -364,7 +394,7 @@ export interface paths {
         };
         /**
          * Validate a preset ID
-         * @description Check if a preset ID is valid and can be used with Lamp.from_keyword.
+         * @description Check if a preset ID is valid and can be used with Lamp.from_keyword. For a plain existence check, HEAD /lamps/presets/{preset_id} is cheaper.
          */
         get: operations["validate_preset_api_v1_lamps_validate_preset__preset_id__get"];
         put?: never;
@@ -874,6 +904,9 @@ export interface paths {
          *     Separated from /lamps/{lamp_id}/info for progressive loading — the main
          *     info endpoint returns TLVs + power instantly while this endpoint
          *     generates the slower matplotlib renders.
+         *
+         *     Rendered images are cached on the session per lamp and reused until the
+         *     lamp's photometry, spectrum or units change.
          */
         get: operations["get_session_lamp_plots_api_v1_session_lamps__lamp_id__info_plots_get"];
         put?: never;
@@ -1271,7 +1304,7 @@ export interface paths {
         };
         /**
          * Get Survival Plot
-         * @description Get survival plot as PNG image.
+         * @description Get survival plot as a base64 image (PNG by default; ?format=svg|webp).
          *
          *     Shows survival fraction over time for key pathogens.
          *
@@ -1327,6 +1360,9 @@ export interface paths {
          *     Returns the authoritative zone state from guv_calcs, which is useful after
          *     room property changes that trigger automatic zone updates (dimensions, units, standard).
          *
+         *     Per-zone states are cached on the session and reused while the zone's
+         *     fingerprint is unchanged, so repeat polls skip the attribute probing.
+         *
          *     Requires X-Session-ID header.
          */
         get: operations["get_session_zones_api_v1_session_zones_get"];
@@ -1431,7 +1467,7 @@ export interface paths {
         };
         /**
          * Get Zone Plot
-         * @description Get a zone's calculation plot as PNG image.
+         * @description Get a zone's calculation plot as a base64 image (PNG by default).
          *
          *     Uses zone.plot() to generate a visualization of the calculated values.
          *     Handles both Plane zones (Matplotlib) and Volume zones (Plotly).
@@ -1974,6 +2010,11 @@ export interface components {
          * @description Complete lamp information for popup display.
          */
         LampInfoResponse: {
+            /**
+             * Content Type
+             * @default image/png
+             */
+            content_type: string;
             /** Has Spectrum */
             has_spectrum: boolean;
             /** Name */
@@ -3769,7 +3810,10 @@ export interface operations {
     };
     get_efficacy_table_api_v1_efficacy_table_post: {
         parameters: {
-            query?: never;
+            query?: {
+                /** @description json (default) or ndjson, one row object per line */
+                format?: "json" | "ndjson";
+            };
             header?: never;
             path?: never;
             cookie?: never;
@@ -3931,6 +3975,8 @@ export interface operations {
                 dpi?: number;
                 /** @description Include 300 DPI hi-res versions */
                 include_hires?: boolean;
+                /** @description Plot image format; WebP is several times smaller than PNG */
+                format?: "png" | "svg" | "webp";
             };
             header?: never;
             path: {
@@ -4013,6 +4059,39 @@ export interface operations {
             };
         };
     };
+    get_preset_photometric_web_binary_api_v1_lamps_photometric_web_bin_post: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody: {
+            content: {
+                "application/json": components["schemas"]["PhotometricWebRequest"];
+            };
+        };
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/octet-stream": unknown;
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
     get_lamp_presets_api_v1_lamps_presets_get: {
         parameters: {
             query?: never;
@@ -4064,6 +4143,44 @@ export interface operations {
             };
         };
     };
+    head_preset_api_v1_lamps_presets__preset_id__head: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path: {
+                preset_id: string;
+            };
+            cookie?: never;
+        };
+        requestBody?: never;
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": unknown;
+                };
+            };
+            /** @description Preset not found */
+            404: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content?: never;
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
     get_lamp_types_api_v1_lamps_types_get: {
         parameters: {
             query?: never;
@@ -5428,6 +5545,7 @@ export interface operations {
                 theme?: string;
                 dpi?: number;
                 species?: string;
+                format?: "png" | "svg" | "webp";
             };
             header?: {
                 authorization?: string | null;
@@ -5707,6 +5825,7 @@ export interface operations {
             query?: {
                 theme?: string;
                 dpi?: number;
+                format?: "png" | "svg" | "webp";
             };
             header?: {
                 authorization?: string | null;